@@ -7,13 +7,7 @@ Python: 3.6+
 """
 
 import sys
-from typing import Type, TypeVar, Optional  # version: 3.6+
-
-from .interfaces.cli_interface import CLIInterface
-from .core.task_manager import TaskManager
-from .exceptions.task_exceptions import TaskError
-from .exceptions.validation_exceptions import ValidationError
-from .exceptions.storage_exceptions import StorageError
+import importlib
 
 # Version and metadata information
 __version__ = "1.0.0"
@@ -21,9 +15,6 @@ __author__ = "Simple To-Do List App Team"
 __package_name__ = "simple-todo-cli"
 __min_python_version__ = "3.6.0"
 
-# Type variable for interface classes
-T = TypeVar('T')
-
 # Expose primary interfaces
 __all__ = [
     'CLIInterface',
@@ -37,10 +28,45 @@ __all__ = [
     '__package_name__'
 ]
 
+# Lazily loaded exports mapped to their defining submodules (PEP 562)
+_LAZY_EXPORTS = {
+    'CLIInterface': '.interfaces.cli_interface',
+    'TaskManager': '.core.task_manager',
+    'TaskError': '.exceptions.task_exceptions',
+    'ValidationError': '.exceptions.validation_exceptions',
+    'StorageError': '.exceptions.storage_exceptions'
+}
+
+def __getattr__(name: str):
+    """
+    Imports exported classes on first access and caches them in module globals.
+
+    Args:
+        name: Attribute name being accessed
+
+    Returns:
+        The requested exported object
+
+    Raises:
+        AttributeError: If name is not a lazily exported attribute
+    """
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Returns the public interface of the package."""
+    return list(__all__)
+
 def validate_environment() -> bool:
     """
-    Validates Python version and required dependencies at runtime.
-    
+    Validates Python version at runtime.
+
+    Not run on import; invoked explicitly by tests or via ``python -m cli --selfcheck``.
+
     Returns:
         bool: True if environment is valid
         
@@ -48,42 +74,10 @@ def validate_environment() -> bool:
         RuntimeError: If environment validation fails
     """
     # Validate Python version
-    current_version = tuple(map(int, sys.version.split('.')[0:3]))
-    required_version = tuple(map(int, __min_python_version__.split('.')))
-    
-    if current_version < required_version:
+    if sys.version_info < (3, 6):
         raise RuntimeError(
             f"Python {__min_python_version__} or higher is required; "
             f"current version is {sys.version.split()[0]}"
         )
 
-    # Validate required modules
-    required_modules = {
-        'typing': '3.6.0',
-        'json': '3.6.0',
-        'datetime': '3.6.0',
-        'os': '3.6.0',
-        'sys': '3.6.0',
-        're': '3.6.0'
-    }
-
-    for module, version in required_modules.items():
-        try:
-            __import__(module)
-        except ImportError:
-            raise RuntimeError(f"Required module {module} (>= {version}) not found")
-
-    # Validate interface class availability
-    required_classes = {
-        'CLIInterface': CLIInterface,
-        'TaskManager': TaskManager
-    }
-
-    for class_name, class_type in required_classes.items():
-        if not isinstance(class_type, type):
-            raise RuntimeError(f"Required class {class_name} not properly initialized")
-
     return True
-
-# Validate environment on import
-validate_environment()
\ No newline at end of file
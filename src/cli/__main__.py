@@ -0,0 +1,36 @@
+"""
+Module execution entry point for the Simple To-Do List App.
+
+Supports ``python -m cli`` to launch the application and
+``python -m cli --selfcheck`` to run environment validation only.
+
+Version: 1.0
+Python: 3.6+
+"""
+
+import sys
+
+
+def _run() -> int:
+    """
+    Dispatches to environment self-check or the main application.
+
+    Returns:
+        int: Exit code (0 for success, 1 for failure)
+    """
+    if '--selfcheck' in sys.argv[1:]:
+        from . import validate_environment
+        try:
+            validate_environment()
+        except RuntimeError as e:
+            print(str(e), file=sys.stderr)
+            return 1
+        print("Environment OK")
+        return 0
+
+    from .main import main
+    return main()
+
+
+if __name__ == '__main__':
+    sys.exit(_run())
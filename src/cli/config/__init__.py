@@ -9,51 +9,81 @@ and proper initialization of all settings required by the application.
 Version: 1.0
 """
 
-from typing import Dict, Any
+import functools
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping
 
 from .settings import (
-    DEBUG,
-    DATA_DIR,
-    TASKS_FILE,
-    BACKUP_FILE,
-    FILE_PERMISSIONS,
-    MAX_TASKS,
-    MAX_DESCRIPTION_LENGTH,
-    OPERATION_TIMEOUT,
-    MAX_FILE_SIZE,
-    LOG_LEVEL,
+    Settings,
     get_config,
     load_config,
+    reset_config,
     validate_config
 )
 
-# Application settings with core configuration values
-APP_SETTINGS: Dict[str, Any] = {
-    'APP_NAME': 'Simple To-Do List App',
-    'APP_VERSION': '1.0',
-    'DEBUG': DEBUG
-}
+# Characters permitted in task descriptions, built once at import
+_ALLOWED_CHARS: FrozenSet[str] = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,!?()-_'
+)
+
+@functools.lru_cache(maxsize=1)
+def _settings_groups(settings: Settings) -> Dict[str, Mapping[str, Any]]:
+    """
+    Builds the grouped settings views from a Settings instance. Keyed on the
+    instance, so a reload through reset_config() rebuilds the views.
+
+    Args:
+        settings: Settings to expose
+
+    Returns:
+        Dict[str, Mapping[str, Any]]: Read-only settings views keyed by name
+    """
+    # Settings dicts are wrapped in read-only views so callers can share them without copying
+    return {
+        # Application settings with core configuration values
+        'APP_SETTINGS': MappingProxyType({
+            'APP_NAME': 'Simple To-Do List App',
+            'APP_VERSION': '1.0',
+            'DEBUG': settings.DEBUG
+        }),
+        # File-related settings for data storage and permissions
+        'FILE_SETTINGS': MappingProxyType({
+            'DATA_DIR': settings.DATA_DIR,
+            'TASKS_FILE': settings.TASKS_FILE,
+            'BACKUP_FILE': settings.BACKUP_FILE,
+            'FILE_PERMISSIONS': settings.FILE_PERMISSIONS
+        }),
+        # Task-specific settings for validation and limits
+        'TASK_SETTINGS': MappingProxyType({
+            'MAX_TASKS': settings.MAX_TASKS,
+            'MAX_DESCRIPTION_LENGTH': settings.MAX_DESCRIPTION_LENGTH,
+            'ALLOWED_CHARS': _ALLOWED_CHARS
+        }),
+        # Performance-related settings for operation limits
+        'PERFORMANCE_SETTINGS': MappingProxyType({
+            'OPERATION_TIMEOUT': settings.OPERATION_TIMEOUT,
+            'MAX_FILE_SIZE': settings.MAX_FILE_SIZE
+        })
+    }
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolves the grouped settings views (APP_SETTINGS, FILE_SETTINGS, ...)
+    on access, so importing this package does not read the environment.
 
-# File-related settings for data storage and permissions
-FILE_SETTINGS: Dict[str, Any] = {
-    'DATA_DIR': DATA_DIR,
-    'TASKS_FILE': TASKS_FILE,
-    'BACKUP_FILE': BACKUP_FILE,
-    'FILE_PERMISSIONS': FILE_PERMISSIONS
-}
+    Args:
+        name: Attribute name being accessed
 
-# Task-specific settings for validation and limits
-TASK_SETTINGS: Dict[str, Any] = {
-    'MAX_TASKS': MAX_TASKS,
-    'MAX_DESCRIPTION_LENGTH': MAX_DESCRIPTION_LENGTH,
-    'ALLOWED_CHARS': set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,!?()-_')
-}
+    Returns:
+        Any: Read-only settings view
 
-# Performance-related settings for operation limits
-PERFORMANCE_SETTINGS: Dict[str, Any] = {
-    'OPERATION_TIMEOUT': OPERATION_TIMEOUT,
-    'MAX_FILE_SIZE': MAX_FILE_SIZE
-}
+    Raises:
+        AttributeError: If name is not a settings group
+    """
+    groups = _settings_groups(Settings.default())
+    if name in groups:
+        return groups[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Re-export configuration management functions
 __all__ = [
@@ -63,5 +93,6 @@ __all__ = [
     'PERFORMANCE_SETTINGS',
     'get_config',
     'load_config',
+    'reset_config',
     'validate_config'
 ]
\ No newline at end of file
@@ -10,27 +10,172 @@ Version: 1.0
 """
 
 import os
+import functools
+from dataclasses import dataclass, fields
 from os import path
-from typing import Dict, Any, Optional, Union
-from dotenv import load_dotenv  # version: 0.19.0
-
-from ..constants.messages import SUCCESS_MESSAGES, ERROR_MESSAGES, INFO_MESSAGES
-from ..types.custom_types import TaskDict, TaskList, ConfigDict, MetadataDict
-
-# Load environment variables with secure defaults
-DEBUG: bool = os.getenv('DEBUG', 'False').lower() == 'true'
-DATA_DIR: str = os.getenv('DATA_DIR', os.path.expanduser('~/.todo/data'))
-TASKS_FILE: str = os.getenv('TASKS_FILE', 'tasks.json')
-BACKUP_FILE: str = os.getenv('BACKUP_FILE', 'tasks.json.bak')
-FILE_PERMISSIONS: int = int(os.getenv('FILE_PERMISSIONS', '600'), 8)
-MAX_TASKS: int = int(os.getenv('MAX_TASKS', '1000'))
-MAX_DESCRIPTION_LENGTH: int = int(os.getenv('MAX_DESCRIPTION_LENGTH', '200'))
-OPERATION_TIMEOUT: int = int(os.getenv('OPERATION_TIMEOUT', '1000'))  # milliseconds
-MAX_FILE_SIZE: int = int(os.getenv('MAX_FILE_SIZE', '1048576'))  # 1MB
-LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'ERROR')
-
-# Configuration cache for performance optimization
-CONFIG_CACHE: Optional[Dict[str, Any]] = None
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+# Optional dotenv file; python-dotenv is only imported when this file exists
+ENV_FILE: str = os.getenv('ENV_FILE', '.env')
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Immutable application settings read from the environment in a single pass.
+
+    Field types are fixed at construction, so validation only needs to check
+    value ranges.
+    """
+
+    DEBUG: bool
+    DATA_DIR: str
+    TASKS_FILE: str
+    BACKUP_FILE: str
+    FILE_PERMISSIONS: int
+    MAX_TASKS: int
+    MAX_DESCRIPTION_LENGTH: int
+    OPERATION_TIMEOUT: int  # milliseconds
+    MAX_FILE_SIZE: int
+    LOG_LEVEL: str
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> 'Settings':
+        """
+        Builds settings from environment variables with secure defaults.
+
+        Args:
+            environ: Mapping to read from, defaults to os.environ
+
+        Returns:
+            Settings: Typed settings instance
+        """
+        get = (os.environ if environ is None else environ).get
+        return cls(
+            DEBUG=get('DEBUG', 'False').lower() == 'true',
+            DATA_DIR=get('DATA_DIR', path.expanduser('~/.todo/data')),
+            TASKS_FILE=get('TASKS_FILE', 'tasks.json'),
+            BACKUP_FILE=get('BACKUP_FILE', 'tasks.json.bak'),
+            FILE_PERMISSIONS=int(get('FILE_PERMISSIONS', '600'), 8),
+            MAX_TASKS=int(get('MAX_TASKS', '1000')),
+            MAX_DESCRIPTION_LENGTH=int(get('MAX_DESCRIPTION_LENGTH', '200')),
+            OPERATION_TIMEOUT=int(get('OPERATION_TIMEOUT', '1000')),
+            MAX_FILE_SIZE=int(get('MAX_FILE_SIZE', '1048576')),  # 1MB
+            LOG_LEVEL=get('LOG_LEVEL', 'ERROR')
+        )
+
+    @classmethod
+    def default(cls) -> 'Settings':
+        """
+        Returns the process-wide settings, loading them on first use.
+
+        Returns:
+            Settings: Cached settings instance
+        """
+        return _default_settings()
+
+    @property
+    def metrics_enabled(self) -> bool:
+        """
+        Whether operation timing should be collected (debug runs only).
+
+        Returns:
+            bool: True if DEBUG is set or LOG_LEVEL is 'DEBUG'
+        """
+        return self.DEBUG or self.LOG_LEVEL == 'DEBUG'
+
+    def validate(self) -> bool:
+        """
+        Validates setting values against security and performance ranges.
+
+        Returns:
+            bool: True if all values are within range
+
+        Raises:
+            ValueError: If any value is out of range
+        """
+        if not (0 <= self.FILE_PERMISSIONS <= 0o777):
+            raise ValueError("FILE_PERMISSIONS must be a valid octal between 000 and 777")
+
+        if not (1 <= self.MAX_TASKS <= 10000):
+            raise ValueError("MAX_TASKS must be between 1 and 10000")
+
+        if not (1 <= self.MAX_DESCRIPTION_LENGTH <= 1000):
+            raise ValueError("MAX_DESCRIPTION_LENGTH must be between 1 and 1000")
+
+        if not (100 <= self.OPERATION_TIMEOUT <= 10000):
+            raise ValueError("OPERATION_TIMEOUT must be between 100 and 10000 milliseconds")
+
+        if not (1024 <= self.MAX_FILE_SIZE <= 10485760):  # 1KB to 10MB
+            raise ValueError("MAX_FILE_SIZE must be between 1KB and 10MB")
+
+        # Validate LOG_LEVEL
+        valid_log_levels = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
+        if self.LOG_LEVEL not in valid_log_levels:
+            raise ValueError(f"LOG_LEVEL must be one of: {', '.join(valid_log_levels)}")
+
+        # Validate paths
+        if not path.isabs(self.DATA_DIR):
+            raise ValueError("DATA_DIR must be an absolute path")
+
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns settings as a configuration dictionary.
+
+        Returns:
+            Dict[str, Any]: Mapping of setting names to values
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+@functools.lru_cache(maxsize=1)
+def _default_settings() -> Settings:
+    """
+    Loads the optional .env file and reads settings from the environment once.
+
+    Returns:
+        Settings: Process-wide settings instance
+    """
+    # Load environment variables from .env file, importing dotenv only if needed
+    if os.access(ENV_FILE, os.R_OK):
+        from dotenv import load_dotenv  # version: 0.19.0
+        load_dotenv(ENV_FILE)
+    return Settings.from_env()
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolves legacy module-level setting names (DEBUG, DATA_DIR, ...) from
+    the default Settings instance.
+
+    Args:
+        name: Attribute name being accessed
+
+    Returns:
+        Any: Setting value
+
+    Raises:
+        AttributeError: If name is not a setting
+    """
+    if name in Settings.__dataclass_fields__:
+        return getattr(Settings.default(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Required configuration keys and their exact expected types
+_REQUIRED_KEYS: Tuple[Tuple[str, type], ...] = (
+    ('DEBUG', bool),
+    ('DATA_DIR', str),
+    ('TASKS_FILE', str),
+    ('BACKUP_FILE', str),
+    ('FILE_PERMISSIONS', int),
+    ('MAX_TASKS', int),
+    ('MAX_DESCRIPTION_LENGTH', int),
+    ('OPERATION_TIMEOUT', int),
+    ('MAX_FILE_SIZE', int),
+    ('LOG_LEVEL', str)
+)
+
+# Sentinel distinguishing missing keys from None values
+_MISSING = object()
 
 def validate_config(config: Dict[str, Any]) -> bool:
     """
@@ -46,80 +191,33 @@ def validate_config(config: Dict[str, Any]) -> bool:
     Raises:
         ValueError: If any configuration value is invalid with detailed message
     """
-    required_keys = {
-        'DEBUG': bool,
-        'DATA_DIR': str,
-        'TASKS_FILE': str,
-        'BACKUP_FILE': str,
-        'FILE_PERMISSIONS': int,
-        'MAX_TASKS': int,
-        'MAX_DESCRIPTION_LENGTH': int,
-        'OPERATION_TIMEOUT': int,
-        'MAX_FILE_SIZE': int,
-        'LOG_LEVEL': str
-    }
-
-    # Verify all required keys exist with correct types
-    for key, expected_type in required_keys.items():
-        if key not in config:
+    # Verify all required keys exist with exact types (bool is not accepted as int)
+    for key, expected_type in _REQUIRED_KEYS:
+        value = config.get(key, _MISSING)
+        if value is _MISSING:
             raise ValueError(f"Missing required configuration key: {key}")
-        if not isinstance(config[key], expected_type):
-            raise ValueError(f"Invalid type for {key}: expected {expected_type}, got {type(config[key])}")
-
-    # Validate numeric ranges
-    if not (0 <= config['FILE_PERMISSIONS'] <= 0o777):
-        raise ValueError("FILE_PERMISSIONS must be a valid octal between 000 and 777")
-    
-    if not (1 <= config['MAX_TASKS'] <= 10000):
-        raise ValueError("MAX_TASKS must be between 1 and 10000")
-    
-    if not (1 <= config['MAX_DESCRIPTION_LENGTH'] <= 1000):
-        raise ValueError("MAX_DESCRIPTION_LENGTH must be between 1 and 1000")
-    
-    if not (100 <= config['OPERATION_TIMEOUT'] <= 10000):
-        raise ValueError("OPERATION_TIMEOUT must be between 100 and 10000 milliseconds")
-    
-    if not (1024 <= config['MAX_FILE_SIZE'] <= 10485760):  # 1KB to 10MB
-        raise ValueError("MAX_FILE_SIZE must be between 1KB and 10MB")
-
-    # Validate LOG_LEVEL
-    valid_log_levels = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
-    if config['LOG_LEVEL'] not in valid_log_levels:
-        raise ValueError(f"LOG_LEVEL must be one of: {', '.join(valid_log_levels)}")
-
-    # Validate paths
-    if not path.isabs(config['DATA_DIR']):
-        raise ValueError("DATA_DIR must be an absolute path")
-
-    return True
+        if type(value) is not expected_type:
+            raise ValueError(f"Invalid type for {key}: expected {expected_type}, got {type(value)}")
 
+    # Validate value ranges
+    return Settings(**{key: config[key] for key, _ in _REQUIRED_KEYS}).validate()
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     """
     Loads and validates environment variables, initializes configuration settings
     with secure defaults, and ensures data directory exists with proper permissions.
 
+    The result is cached, so environment loading, validation and directory setup
+    run once per process. Use reset_config() to force a reload.
+
     Returns:
         Dict[str, Any]: Validated configuration dictionary with all settings
     """
-    # Load environment variables from .env file
-    load_dotenv()
-
-    # Initialize configuration dictionary
-    config = {
-        'DEBUG': DEBUG,
-        'DATA_DIR': DATA_DIR,
-        'TASKS_FILE': TASKS_FILE,
-        'BACKUP_FILE': BACKUP_FILE,
-        'FILE_PERMISSIONS': FILE_PERMISSIONS,
-        'MAX_TASKS': MAX_TASKS,
-        'MAX_DESCRIPTION_LENGTH': MAX_DESCRIPTION_LENGTH,
-        'OPERATION_TIMEOUT': OPERATION_TIMEOUT,
-        'MAX_FILE_SIZE': MAX_FILE_SIZE,
-        'LOG_LEVEL': LOG_LEVEL
-    }
-
-    # Validate configuration
-    validate_config(config)
+    # Read and range-check settings; types are fixed by the Settings dataclass
+    settings = Settings.default()
+    settings.validate()
+    config = settings.to_dict()
 
     # Ensure data directory exists with proper permissions
     if not path.exists(config['DATA_DIR']):
@@ -128,10 +226,6 @@ def load_config() -> Dict[str, Any]:
         # Update permissions on existing directory
         os.chmod(config['DATA_DIR'], config['FILE_PERMISSIONS'])
 
-    # Cache configuration
-    global CONFIG_CACHE
-    CONFIG_CACHE = config
-
     return config
 
 def get_config() -> Dict[str, Any]:
@@ -141,7 +235,12 @@ def get_config() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Current configuration dictionary
     """
-    global CONFIG_CACHE
-    if CONFIG_CACHE is None:
-        return load_config()
-    return CONFIG_CACHE
\ No newline at end of file
+    return load_config()
+
+def reset_config() -> None:
+    """
+    Clears the cached configuration so the next access reloads it.
+    Intended for tests that change environment variables between runs.
+    """
+    _default_settings.cache_clear()
+    load_config.cache_clear()
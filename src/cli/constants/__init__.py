@@ -6,26 +6,24 @@ symbols, UI elements, and validation parameters.
 Version: 1.0
 """
 
-# Import all message constants
-from .messages import (
-    WELCOME_MESSAGE,
-    MAIN_MENU_OPTIONS,
-    INPUT_PROMPTS,
-    SUCCESS_MESSAGES,
-    ERROR_MESSAGES,
-    INFO_MESSAGES,
-    HELP_MESSAGES,
-    GUIDELINES
-)
+import importlib
 
-# Import all symbol constants
-from .symbols import (
-    NAVIGATION_SYMBOLS,
-    STATUS_SYMBOLS,
-    ACTION_SYMBOLS,
-    BORDER_SYMBOLS,
-    MENU_SYMBOLS
-)
+# Message and symbol constants loaded on first access (PEP 562)
+_LAZY_EXPORTS = {
+    'WELCOME_MESSAGE': '.messages',
+    'MAIN_MENU_OPTIONS': '.messages',
+    'INPUT_PROMPTS': '.messages',
+    'SUCCESS_MESSAGES': '.messages',
+    'ERROR_MESSAGES': '.messages',
+    'INFO_MESSAGES': '.messages',
+    'HELP_MESSAGES': '.messages',
+    'GUIDELINES': '.messages',
+    'NAVIGATION_SYMBOLS': '.symbols',
+    'STATUS_SYMBOLS': '.symbols',
+    'ACTION_SYMBOLS': '.symbols',
+    'BORDER_SYMBOLS': '.symbols',
+    'MENU_SYMBOLS': '.symbols'
+}
 
 # Application-wide constants
 APP_VERSION = "1.0"
@@ -61,4 +59,28 @@ __all__ = [
     'MAX_TASK_LENGTH',
     'MAX_TASKS',
     'SCREEN_WIDTH'
-]
\ No newline at end of file
+]
+
+def __getattr__(name: str):
+    """
+    Imports message and symbol constants on first access and caches them.
+
+    Args:
+        name: Attribute name being accessed
+
+    Returns:
+        The requested constant
+
+    Raises:
+        AttributeError: If name is not a lazily exported constant
+    """
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Returns the public interface of the constants package."""
+    return list(__all__)
@@ -1,13 +1,17 @@
+# -*- coding: utf-8 -*-
 """
 Defines constant symbol dictionaries for visual elements used in the command-line interface formatting.
 Includes navigation symbols, status indicators, action symbols, border characters, and menu formatting
 symbols for consistent UI presentation across the application.
+
+Each table is a read-only MappingProxyType view so the constants cannot be mutated.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 # Navigation symbols used for menu traversal and interface flow control
-NAVIGATION_SYMBOLS: Dict[str, str] = {
+NAVIGATION_SYMBOLS: Mapping[str, str] = MappingProxyType({
     'BACK': '[<]',      # Return to previous menu
     'FORWARD': '[>]',   # Proceed to next menu
     'UP': '[^]',        # Navigate upward/return to main
@@ -16,20 +20,20 @@ NAVIGATION_SYMBOLS: Dict[str, str] = {
     'ESCAPE': '[Esc]',  # Cancel/exit current operation
     'CONTINUE': '...',  # Indicates more content
     'PAGE': 'Page'      # Page indicator prefix
-}
+})
 
 # Status symbols for task and message state representation
-STATUS_SYMBOLS: Dict[str, str] = {
+STATUS_SYMBOLS: Mapping[str, str] = MappingProxyType({
     'PENDING': '[ ]',   # Uncompleted task
     'COMPLETED': '[x]', # Completed task
     'ERROR': '[!]',     # Error message indicator
     'INFO': '[i]',      # Information message indicator
     'WARNING': '[⚠]',   # Warning message indicator
     'SUCCESS': '[✓]'    # Success message indicator
-}
+})
 
 # Action symbols for interactive interface elements
-ACTION_SYMBOLS: Dict[str, str] = {
+ACTION_SYMBOLS: Mapping[str, str] = MappingProxyType({
     'ADD': '[+]',       # Add new item
     'REMOVE': '[-]',    # Remove item
     'MENU': '[#]',      # Menu options
@@ -37,29 +41,29 @@ ACTION_SYMBOLS: Dict[str, str] = {
     'HELP': '[?]',      # Help/documentation
     'SAVE': '[💾]',     # Save changes
     'EDIT': '[✎]'      # Edit item
-}
+})
 
 # Border characters for UI layout construction
-BORDER_SYMBOLS: Dict[str, str] = {
-    'TOP_LEFT': '+',     # Corner piece ┌
-    'TOP_RIGHT': '+',    # Corner piece ┐
-    'BOTTOM_LEFT': '+',  # Corner piece └
-    'BOTTOM_RIGHT': '+', # Corner piece ┘
-    'HORIZONTAL': '-',   # Horizontal line ─
-    'VERTICAL': '|',     # Vertical line │
-    'INTERSECTION': '+', # Cross intersection ┼
-    'T_TOP': '+',        # T-piece ┬
-    'T_BOTTOM': '+',     # T-piece ┴
-    'T_LEFT': '+',       # T-piece ├
-    'T_RIGHT': '+'       # T-piece ┤
-}
+BORDER_SYMBOLS: Mapping[str, str] = MappingProxyType({
+    'TOP_LEFT': '┌',     # Corner piece
+    'TOP_RIGHT': '┐',    # Corner piece
+    'BOTTOM_LEFT': '└',  # Corner piece
+    'BOTTOM_RIGHT': '┘', # Corner piece
+    'HORIZONTAL': '─',   # Horizontal line
+    'VERTICAL': '│',     # Vertical line
+    'INTERSECTION': '┼', # Cross intersection
+    'T_TOP': '┬',        # T-piece
+    'T_BOTTOM': '┴',     # T-piece
+    'T_LEFT': '├',       # T-piece
+    'T_RIGHT': '┤'       # T-piece
+})
 
 # Menu formatting symbols for visual hierarchy
-MENU_SYMBOLS: Dict[str, str] = {
+MENU_SYMBOLS: Mapping[str, str] = MappingProxyType({
     'OPTION': '•',      # Menu option bullet point
     'PROMPT': '>',      # Input prompt indicator
     'SEPARATOR': '|',   # Visual element separator
     'BULLET': '•',      # Generic bullet point
     'ARROW': '→',      # Direction/selection indicator
     'INDENT': '  '      # Standard indentation spacing
-}
\ No newline at end of file
+})
\ No newline at end of file
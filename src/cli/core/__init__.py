@@ -9,25 +9,50 @@ Version: 1.0
 Python: 3.6+
 """
 
-from .task_manager import TaskManager
-from .validators import (
-    validate_task_description,
-    validate_menu_option,
-    validate_task_number
-)
+import importlib
 
 # Define public interface
 __all__ = [
     'TaskManager',
     'validate_task_description',
     'validate_menu_option', 
-    'validate_task_number'
+    'validate_task_number',
+    'validate_task_number_int'
 ]
 
+# Lazily loaded exports mapped to their defining submodules (PEP 562)
+_LAZY_EXPORTS = {
+    'TaskManager': '.task_manager',
+    'validate_task_description': '.validators',
+    'validate_menu_option': '.validators',
+    'validate_task_number': '.validators',
+    'validate_task_number_int': '.validators'
+}
+
 # Module metadata
 __version__ = '1.0.0'
 __author__ = 'Simple To-Do List App Team'
 
-# Validate imports to ensure core components are available
-if not all(component in globals() for component in __all__):
-    raise ImportError("Core components failed to load properly")
\ No newline at end of file
+def __getattr__(name: str):
+    """
+    Imports core components on first access and caches them in module globals.
+
+    Args:
+        name: Attribute name being accessed
+
+    Returns:
+        The requested core component
+
+    Raises:
+        AttributeError: If name is not a core component
+    """
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Returns the public interface of the core package."""
+    return list(__all__)
@@ -9,13 +9,16 @@ Python: 3.6+
 """
 
 from datetime import datetime
+import functools
 import time
 import logging
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional, Sequence, Tuple
 
-from ..models.task import Task
+from ..models.task import Task, STATUS_PENDING, STATUS_COMPLETED
 from ..data.storage import TaskStorage
-from .validators import validate_task_description, validate_task_number, sanitize_input
+from ..config.settings import Settings
+from .validators import validate_task_description, validate_task_number_int, sanitize_input
 from ..exceptions.task_exceptions import TaskNotFoundError, TaskLimitError
 from ..exceptions.validation_exceptions import ValidationError
 from ..constants.messages import SUCCESS_MESSAGES, ERROR_MESSAGES
@@ -23,6 +26,14 @@ from ..constants.messages import SUCCESS_MESSAGES, ERROR_MESSAGES
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Canonical status values shared with the Task model, so status checks on
+# cached tasks can compare by identity
+_STATUS_PENDING: Final[str] = STATUS_PENDING
+_STATUS_COMPLETED: Final[str] = STATUS_COMPLETED
+
+# Operation timing is only wired in for debug runs; read once at import
+_ENABLE_METRICS: Final[bool] = Settings.default().metrics_enabled
+
 class TaskManager:
     """
     Enhanced task manager with security, performance monitoring, and validation features.
@@ -41,8 +52,12 @@ class TaskManager:
         """
         self._storage = TaskStorage(storage_path)
         self._task_cache: Dict[int, Task] = {}
+        # Task IDs in insertion order, so a page is a plain list slice
+        self._task_order: List[int] = []
+        # IDs of pending tasks in insertion order (dict used as an ordered set)
+        self._pending_ids: Dict[int, None] = {}
         self._performance_metrics: Dict[str, float] = {}
-        self._transaction_active = False
+        self._next_id = 1
         
         # Load existing tasks into cache
         self._load_cache()
@@ -52,28 +67,46 @@ class TaskManager:
         """
         Load existing tasks into memory cache with validation.
         """
+        cache = self._task_cache = {}
+        order = self._task_order = []
+        pending = self._pending_ids = {}
         try:
             tasks = self._storage.get_all_tasks()
-            self._task_cache = {task.id: task for task in tasks}
-            logger.debug(f"Loaded {len(tasks)} tasks into cache")
+            for task in tasks:
+                if task.id not in cache:
+                    order.append(task.id)
+                cache[task.id] = task
+                if task.status == _STATUS_PENDING:
+                    pending[task.id] = None
+                else:
+                    pending.pop(task.id, None)
+            logger.debug("Loaded %d tasks into cache", len(tasks))
         except Exception as e:
-            logger.error(f"Cache loading failed: {str(e)}")
-            self._task_cache = {}
+            # Keep whatever was loaded before the failure
+            logger.error("Cache loading failed: %s", e)
+
+        # IDs are monotonic; gaps left by failed inserts are not reused
+        self._next_id = max(self._task_cache, default=0) + 1
 
     def _measure_performance(func):
         """
         Decorator for monitoring operation performance.
+        Returns func unwrapped unless metrics are enabled via DEBUG/LOG_LEVEL.
         """
+        if not _ENABLE_METRICS:
+            return func
+
+        @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(self, *args, **kwargs)
-                execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e6  # Convert to milliseconds
                 self._performance_metrics[func.__name__] = execution_time
-                logger.debug(f"{func.__name__} completed in {execution_time:.2f}ms")
+                logger.debug("%s completed in %.2fms", func.__name__, execution_time)
                 return result
             except Exception as e:
-                logger.error(f"{func.__name__} failed: {str(e)}")
+                logger.error("%s failed: %s", func.__name__, e)
                 raise
         return wrapper
 
@@ -102,31 +135,31 @@ class TaskManager:
             clean_description = sanitize_input(description)
             validate_task_description(clean_description)
 
-            # Generate new task ID
-            new_id = max(self._task_cache.keys(), default=0) + 1
+            # Generate new task ID; only consumed once the task is stored
+            new_id = self._next_id
 
             # Create task with current timestamp
             task = Task(
                 id=new_id,
                 description=clean_description,
-                status='pending',
+                status=_STATUS_PENDING,
                 created=datetime.utcnow(),
                 modified=datetime.utcnow()
             )
 
-            # Atomic transaction
-            self._storage.begin_transaction()
-            self._storage.add_task(task)
+            # Atomic transaction; manager state changes only after it succeeds
+            with self._storage.transaction(new_id):
+                self._storage.add_task(task)
+            self._next_id = new_id + 1
             self._task_cache[task.id] = task
-            self._storage.commit_transaction()
+            self._task_order.append(task.id)
+            self._pending_ids[task.id] = None
 
-            logger.info(f"Task created successfully: ID {task.id}")
+            logger.info("Task created successfully: ID %s", task.id)
             return task
 
         except Exception as e:
-            if self._transaction_active:
-                self._storage.rollback_transaction()
-            logger.error(f"Task creation failed: {str(e)}")
+            logger.error("Task creation failed: %s", e)
             raise
 
     @_measure_performance
@@ -144,15 +177,15 @@ class TaskManager:
             TaskNotFoundError: If task not found
         """
         try:
-            # Validate task number
-            validate_task_number(str(task_id), len(self._task_cache))
+            # Check cache first; cached IDs are already known to be valid
+            task = self._task_cache.get(task_id)
+            if task is not None:
+                logger.debug("Task %s retrieved from cache", task_id)
+                return task
 
-            # Check cache first
-            if task_id in self._task_cache:
-                logger.debug(f"Task {task_id} retrieved from cache")
-                return self._task_cache[task_id]
+            # Validate task number before falling back to storage
+            validate_task_number_int(task_id, len(self._task_cache))
 
-            # Fallback to storage
             task = self._storage.get_task(task_id)
             if task:
                 self._task_cache[task_id] = task
@@ -161,11 +194,11 @@ class TaskManager:
             raise TaskNotFoundError(task_id)
 
         except Exception as e:
-            logger.error(f"Task retrieval failed: {str(e)}")
+            logger.error("Task retrieval failed: %s", e)
             raise
 
     @_measure_performance
-    def get_all_tasks(self, page_size: Optional[int] = None, page_number: Optional[int] = None) -> List[Task]:
+    def get_all_tasks(self, page_size: Optional[int] = None, page_number: Optional[int] = None) -> Sequence[Task]:
         """
         Retrieve all tasks with optional pagination.
 
@@ -174,30 +207,41 @@ class TaskManager:
             page_number: Page number to retrieve
 
         Returns:
-            List[Task]: List of tasks
+            Sequence[Task]: Requested tasks; treat as read-only
 
         Raises:
             ValueError: If pagination parameters invalid
         """
         try:
-            tasks = list(self._task_cache.values())
-            
-            # Apply pagination if specified
+            # Apply pagination if specified, slicing only the requested IDs
             if page_size and page_number:
                 if page_size < 1 or page_number < 1:
                     raise ValueError("Invalid pagination parameters")
                     
                 start_idx = (page_number - 1) * page_size
                 end_idx = start_idx + page_size
-                tasks = tasks[start_idx:end_idx]
+                cache = self._task_cache
+                tasks = [cache[task_id] for task_id in self._task_order[start_idx:end_idx]]
+            else:
+                tasks = tuple(self._task_cache.values())
 
-            logger.debug(f"Retrieved {len(tasks)} tasks")
+            logger.debug("Retrieved %d tasks", len(tasks))
             return tasks
 
         except Exception as e:
-            logger.error(f"Task retrieval failed: {str(e)}")
+            logger.error("Task retrieval failed: %s", e)
             raise
 
+    def get_pending_tasks(self) -> List[Task]:
+        """
+        Retrieve pending tasks in creation order without scanning all tasks.
+
+        Returns:
+            List[Task]: Tasks whose status is pending
+        """
+        cache = self._task_cache
+        return [cache[task_id] for task_id in self._pending_ids]
+
     @_measure_performance
     def complete_task(self, task_id: int) -> bool:
         """
@@ -219,30 +263,37 @@ class TaskManager:
             if not task:
                 raise TaskNotFoundError(task_id)
 
-            # Atomic transaction
-            self._storage.begin_transaction()
-            
-            # Update task status
-            task.mark_complete()
-            self._storage.update_task(task)
-            self._task_cache[task_id] = task
-            
-            self._storage.commit_transaction()
+            # Complete a copy, so a failed save leaves the cached task untouched
+            updated = Task._from_trusted_dict(task.to_dict())
+            updated.mark_complete()
+
+            # Atomic transaction; manager state changes only after it succeeds
+            with self._storage.transaction(task_id):
+                self._storage.update_task(updated)
+            self._task_cache[task_id] = updated
+            self._pending_ids.pop(task_id, None)
             
-            logger.info(f"Task {task_id} marked complete")
+            logger.info("Task %s marked complete", task_id)
             return True
 
         except Exception as e:
-            if self._transaction_active:
-                self._storage.rollback_transaction()
-            logger.error(f"Task completion failed: {str(e)}")
+            logger.error("Task completion failed: %s", e)
             raise
 
-    def get_performance_metrics(self) -> Dict[str, float]:
+    def close(self) -> None:
+        """
+        Fold journaled changes into the task file and release storage handles.
+
+        Raises:
+            FileAccessError: If the final write fails
+        """
+        self._storage.close()
+
+    def get_performance_metrics(self) -> Mapping[str, float]:
         """
         Retrieve performance metrics for monitoring.
 
         Returns:
-            Dict[str, float]: Operation timing metrics
+            Mapping[str, float]: Read-only live view of operation timing metrics
         """
-        return self._performance_metrics.copy()
\ No newline at end of file
+        return MappingProxyType(self._performance_metrics)
\ No newline at end of file
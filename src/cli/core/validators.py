@@ -7,11 +7,13 @@ ensuring data integrity and security through strict validation rules and sanitiz
 Version: 1.0
 """
 
-import re  # version: 3.6+
+import functools
+import string
 from datetime import datetime
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 
 from ..types.custom_types import TaskId, TaskStatus, TaskDict
+from ..models.task import VALID_STATUSES
 from ..exceptions.validation_exceptions import (
     ValidationError,
     TaskDescriptionValidationError,
@@ -20,10 +22,30 @@ from ..exceptions.validation_exceptions import (
 )
 from ..constants.messages import ERROR_MESSAGES
 
+# Error messages bound once at import; a missing key fails here, not on first raise
+_MSG_EMPTY = ERROR_MESSAGES['empty_description']
+_MSG_TOO_LONG = ERROR_MESSAGES['description_too_long']
+_MSG_INVALID_CHARS = ERROR_MESSAGES['invalid_chars']
+_MSG_INVALID_INPUT = ERROR_MESSAGES['invalid_input']
+_MSG_INVALID_TASK_NUM = ERROR_MESSAGES['invalid_task_number']
+
 # Constants for validation rules
 TASK_DESCRIPTION_MAX_LENGTH = 200
-TASK_DESCRIPTION_PATTERN = r'^[a-zA-Z0-9\s\.,!?-]*$'
-MENU_OPTIONS = [1, 2, 3, 4]
+_DESCRIPTION_ALLOWED_CHARS = string.ascii_letters + string.digits + '.,!?-'
+# 256-entry acceptance table for ASCII input: allowed bytes (including every
+# ASCII whitespace byte) map to themselves, everything else to 0xFF
+_DESCRIPTION_ACCEPT = bytes(
+    b if chr(b) in _DESCRIPTION_ALLOWED_CHARS or chr(b).isspace() else 0xFF
+    for b in range(256)
+)
+# Non-ASCII fallback: delete allowed characters; anything left must be whitespace
+_DESCRIPTION_ALLOWED_DELETE = str.maketrans('', '', _DESCRIPTION_ALLOWED_CHARS)
+MENU_OPTIONS = frozenset((1, 2, 3, 4))
+# Longer digit strings are out of range for any menu option or task number
+_MAX_NUMBER_DIGITS = 9
+_REQUIRED_TASK_FIELDS = frozenset(('id', 'description', 'status'))
+_VALID_STATUSES = VALID_STATUSES
+_TIMESTAMP_FIELDS = ('created', 'modified')
 
 def validate_task_description(description: str) -> bool:
     """
@@ -38,22 +60,60 @@ def validate_task_description(description: str) -> bool:
     Raises:
         TaskDescriptionValidationError: If validation fails
     """
-    if not description or description.isspace():
-        raise TaskDescriptionValidationError(ERROR_MESSAGES['empty_description'])
+    if not description:
+        raise TaskDescriptionValidationError(_MSG_EMPTY)
+    
+    error_message = _description_error(description)
+    if error_message is not None:
+        raise TaskDescriptionValidationError(error_message)
+    return True
+
+@functools.lru_cache(maxsize=256)
+def _description_error(description: str) -> Optional[str]:
+    """
+    Checks a non-empty description, memoized for repeated submissions.
+    
+    lru_cache does not cache raised exceptions, so the outcome is returned
+    as the error message to raise with, or None when valid.
+    
+    Args:
+        description (str): Task description to check
+        
+    Returns:
+        Optional[str]: Error message for the failure, None if valid
+    """
+    if description.isspace():
+        return _MSG_EMPTY
     
-    # Strip whitespace and validate length
-    cleaned_description = description.strip()
+    # Strip whitespace (only copying when there is any to strip) and validate length
+    if description[0].isspace() or description[-1].isspace():
+        cleaned_description = description.strip()
+    else:
+        cleaned_description = description
     if len(cleaned_description) > TASK_DESCRIPTION_MAX_LENGTH:
-        raise TaskDescriptionValidationError(ERROR_MESSAGES['description_too_long'])
+        return _MSG_TOO_LONG
         
-    # Validate against allowed character pattern with timeout protection
-    try:
-        if not re.match(TASK_DESCRIPTION_PATTERN, cleaned_description, re.UNICODE):
-            raise TaskDescriptionValidationError(ERROR_MESSAGES['invalid_chars'])
-    except re.error:
-        raise TaskDescriptionValidationError(ERROR_MESSAGES['system_error'])
+    # Validate allowed characters with a single table-driven pass
+    if not has_only_description_chars(cleaned_description):
+        return _MSG_INVALID_CHARS
         
-    return True
+    return None
+
+def has_only_description_chars(text: str) -> bool:
+    """
+    Checks that text uses only characters allowed in task descriptions:
+    ASCII letters, digits, whitespace and .,!?-
+    
+    Args:
+        text (str): Text to check
+        
+    Returns:
+        bool: True if every character is allowed
+    """
+    if text.isascii():
+        return b'\xff' not in text.encode('ascii').translate(_DESCRIPTION_ACCEPT)
+    remainder = text.translate(_DESCRIPTION_ALLOWED_DELETE)
+    return not remainder or remainder.isspace()
 
 def validate_menu_option(option: str) -> int:
     """
@@ -68,13 +128,14 @@ def validate_menu_option(option: str) -> int:
     Raises:
         MenuOptionValidationError: If validation fails
     """
-    try:
-        option_num = int(option.strip())
-        if option_num not in MENU_OPTIONS:
-            raise MenuOptionValidationError(ERROR_MESSAGES['invalid_input'])
-        return option_num
-    except (ValueError, TypeError):
-        raise MenuOptionValidationError(ERROR_MESSAGES['invalid_input'])
+    # Gate int() behind a digit check so typos never hit the exception path
+    stripped = option.strip() if isinstance(option, str) else ''
+    if not stripped.isdecimal() or len(stripped) > _MAX_NUMBER_DIGITS:
+        raise MenuOptionValidationError(_MSG_INVALID_INPUT)
+    option_num = int(stripped)
+    if option_num not in MENU_OPTIONS:
+        raise MenuOptionValidationError(_MSG_INVALID_INPUT)
+    return option_num
 
 def validate_task_number(task_number: str, max_tasks: int) -> int:
     """
@@ -90,19 +151,34 @@ def validate_task_number(task_number: str, max_tasks: int) -> int:
     Raises:
         TaskNumberValidationError: If validation fails
     """
-    try:
-        num = int(task_number.strip())
-        if not 1 <= num <= max_tasks:
-            raise TaskNumberValidationError(
-                ERROR_MESSAGES['invalid_task_number'],
-                max_tasks
-            )
-        return num
-    except (ValueError, TypeError):
+    stripped = task_number.strip() if isinstance(task_number, str) else ''
+    if not stripped.isdecimal() or len(stripped) > _MAX_NUMBER_DIGITS:
         raise TaskNumberValidationError(
-            ERROR_MESSAGES['invalid_task_number'],
+            _MSG_INVALID_TASK_NUM,
             max_tasks
         )
+    return validate_task_number_int(int(stripped), max_tasks)
+
+def validate_task_number_int(task_number: int, max_tasks: int) -> int:
+    """
+    Validates an already-parsed task number against available task range.
+    
+    Args:
+        task_number (int): Task number to validate
+        max_tasks (int): Maximum number of available tasks
+        
+    Returns:
+        int: Validated task number
+        
+    Raises:
+        TaskNumberValidationError: If validation fails
+    """
+    if type(task_number) is not int or not 1 <= task_number <= max_tasks:
+        raise TaskNumberValidationError(
+            _MSG_INVALID_TASK_NUM,
+            max_tasks
+        )
+    return task_number
 
 def validate_task_data(task_data: TaskDict) -> bool:
     """
@@ -117,36 +193,34 @@ def validate_task_data(task_data: TaskDict) -> bool:
     Raises:
         ValidationError: If validation fails
     """
-    required_fields = {'id', 'description', 'status'}
-    
     # Validate dictionary structure
     if not isinstance(task_data, dict):
-        raise ValidationError(ERROR_MESSAGES['invalid_input'], "E004")
+        raise ValidationError(_MSG_INVALID_INPUT, "E004")
         
     # Check required fields
-    if not all(field in task_data for field in required_fields):
-        raise ValidationError(ERROR_MESSAGES['invalid_input'], "E005")
+    if not _REQUIRED_TASK_FIELDS.issubset(task_data):
+        raise ValidationError(_MSG_INVALID_INPUT, "E005")
         
     # Validate field types and values
     try:
         # ID validation
         if not isinstance(task_data['id'], (int, str)):
-            raise ValidationError(ERROR_MESSAGES['invalid_input'], "E006")
+            raise ValidationError(_MSG_INVALID_INPUT, "E006")
             
         # Description validation
         validate_task_description(task_data['description'])
         
         # Status validation
-        if task_data['status'] not in ('pending', 'completed'):
-            raise ValidationError(ERROR_MESSAGES['invalid_input'], "E007")
+        if task_data['status'] not in _VALID_STATUSES:
+            raise ValidationError(_MSG_INVALID_INPUT, "E007")
             
         # Timestamp validation if present
-        for field in ('created', 'modified'):
+        for field in _TIMESTAMP_FIELDS:
             if field in task_data:
                 if not isinstance(task_data[field], datetime):
-                    raise ValidationError(ERROR_MESSAGES['invalid_input'], "E008")
+                    raise ValidationError(_MSG_INVALID_INPUT, "E008")
                     
     except (KeyError, TypeError):
-        raise ValidationError(ERROR_MESSAGES['invalid_input'], "E009")
+        raise ValidationError(_MSG_INVALID_INPUT, "E009")
         
     return True
\ No newline at end of file
@@ -17,33 +17,3 @@ __all__ = ['TaskStorage']
 __version__ = '1.0'
 __author__ = 'Simple To-Do List App'
 __description__ = 'Secure task persistence interface for Simple To-Do List App'
-
-# Verify TaskStorage implementation meets security requirements
-def __verify_storage_implementation():
-    """
-    Internal verification of TaskStorage security requirements.
-    Runs on module import to ensure critical security features are present.
-    """
-    required_methods = {
-        'load_tasks',
-        'save_tasks',
-        'add_task',
-        'update_task',
-        'get_task',
-        'create_backup'
-    }
-    
-    # Verify all required methods are implemented
-    implemented_methods = {
-        method for method in dir(TaskStorage) 
-        if not method.startswith('_')
-    }
-    
-    if not required_methods.issubset(implemented_methods):
-        missing = required_methods - implemented_methods
-        raise ImportError(
-            f"TaskStorage missing required security methods: {missing}"
-        )
-
-# Run implementation verification on import
-__verify_storage_implementation()
\ No newline at end of file
@@ -3,18 +3,22 @@ Storage module for the Simple To-Do List application.
 
 Implements secure file-based task persistence with atomic operations,
 proper error handling, and backup mechanisms according to technical specifications.
+Single-task mutations are appended to a JSON-lines journal next to the task file
+and folded into it by the next full save.
 
 Version: 1.0
 Python: 3.6+
 """
 
 import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from ..models.task import Task
-from ..exceptions.storage_exceptions import FileAccessError, DataCorruptionError
-from ..utils.file_utils import read_json_file, write_json_file, create_backup
+from ..exceptions.storage_exceptions import FileAccessError, FileNotFoundStorageError, DataCorruptionError
+from ..exceptions.task_exceptions import TaskValidationError
+from ..utils.file_utils import read_json_file, write_json_file, create_backup, encode_json, decode_json
 from ..logging.logger import get_logger
 
 # Constants for storage configuration
@@ -22,6 +26,13 @@ DEFAULT_FILENAME = "todo_tasks.json"
 DATA_VERSION = "1.0"
 MAX_TASKS = 1000
 MAX_FILE_SIZE = 1048576  # 1MB
+JOURNAL_SUFFIX = ".log"
+JOURNAL_MAX_SIZE = 65536  # 64KB; larger journals are compacted into the task file
+JOURNAL_PERMISSIONS = 0o600
+
+# Journal appends only need the data on disk; fdatasync skips the inode
+# timestamp flush where the platform provides it
+_sync_journal = getattr(os, 'fdatasync', os.fsync)
 
 # Initialize logger
 logger = get_logger()
@@ -45,21 +56,33 @@ class TaskStorage:
             FileAccessError: If file access or permissions fail
         """
         self._file_path = os.path.abspath(os.path.expanduser(file_path))
+        self._journal_path = self._file_path + JOURNAL_SUFFIX
+        self._journal_fh = None
         self._tasks: List[Task] = []
+        # Task ID -> position in self._tasks, kept in step with every mutation
+        self._index: Dict[int, int] = {}
+        # True while in-memory tasks differ from the task file
+        self._dirty = True
+        # Nesting depth of batch() blocks; mutations skip the journal while > 0
+        self._batch_depth = 0
         self._metadata: Dict[str, Any] = {
             "version": DATA_VERSION,
             "last_modified": datetime.utcnow().isoformat(),
             "task_count": 0
         }
         
-        # Ensure storage directory exists with proper permissions
-        os.makedirs(os.path.dirname(self._file_path), mode=0o600, exist_ok=True)
+        # Ensure storage directory exists; directories need the execute bit
+        storage_dir = os.path.dirname(self._file_path)
+        if storage_dir and not os.path.isdir(storage_dir):
+            os.makedirs(storage_dir, mode=0o700, exist_ok=True)
         
-        # Load existing data if file exists
-        if os.path.exists(self._file_path):
+        # Load existing data, initializing new storage if there is none yet.
+        # A journal left without its task file still holds changes, so it is
+        # replayed into the new file rather than truncated by the first save
+        try:
             self.load_tasks()
-        else:
-            # Initialize new storage
+        except FileNotFoundStorageError:
+            self._replay_journal()
             self.save_tasks()
     
     def load_tasks(self) -> List[Task]:
@@ -70,27 +93,31 @@ class TaskStorage:
             List[Task]: List of loaded tasks
             
         Raises:
+            FileNotFoundStorageError: If storage file does not exist
             FileAccessError: If file access fails
             DataCorruptionError: If data is invalid
         """
         try:
+            # read_json_file has already checked the tasks/metadata structure
             data = read_json_file(self._file_path)
             
-            # Validate data structure
-            if not isinstance(data, dict) or "tasks" not in data or "metadata" not in data:
-                raise DataCorruptionError("Invalid data structure in storage file")
-                
             # Validate version compatibility
             if data["metadata"].get("version") != DATA_VERSION:
                 raise DataCorruptionError(f"Incompatible data version: {data['metadata'].get('version')}")
                 
             # Convert task dictionaries to Task objects
-            self._tasks = [Task.from_dict(task_data) for task_data in data["tasks"]]
+            # Files written by this application skip per-task validation
+            self._tasks = [Task._from_trusted_dict(task_data) for task_data in data["tasks"]]
+            self._index = {task.id: i for i, task in enumerate(self._tasks)}
             self._metadata = data["metadata"]
+            self._dirty = False
+            self._replay_journal()
             
             logger.debug(f"Successfully loaded {len(self._tasks)} tasks from storage")
             return self._tasks
             
+        except FileNotFoundStorageError:
+            raise
         except (FileAccessError, DataCorruptionError) as e:
             logger.error(f"Failed to load tasks: {str(e)}")
             raise
@@ -106,20 +133,23 @@ class TaskStorage:
             FileAccessError: If file write fails
         """
         try:
-            # Update metadata
-            self._metadata.update({
-                "last_modified": datetime.utcnow().isoformat(),
-                "task_count": len(self._tasks)
-            })
+            # Update metadata only when content actually changed
+            if self._dirty:
+                self._metadata.update({
+                    "last_modified": datetime.utcnow().isoformat(),
+                    "task_count": len(self._tasks)
+                })
             
             # Prepare data structure
             data = {
-                "tasks": [task.to_dict() for task in self._tasks],
+                "tasks": [task._as_dict() for task in self._tasks],
                 "metadata": self._metadata
             }
             
-            # Perform atomic write with backup
+            # Perform atomic write with backup; the journal is now folded in
             write_json_file(self._file_path, data)
+            self._dirty = False
+            self._truncate_journal()
             logger.debug("Successfully saved tasks to storage")
             return True
             
@@ -127,6 +157,209 @@ class TaskStorage:
             logger.error(f"Failed to save tasks: {str(e)}")
             raise
     
+    def compact(self) -> bool:
+        """
+        Fold the mutation journal into the task file.
+        
+        The task file is only rewritten when there are unsaved changes.
+        
+        Returns:
+            bool: True if compaction successful
+            
+        Raises:
+            FileAccessError: If file write fails
+        """
+        if not self._dirty:
+            self._truncate_journal()
+            return True
+        return self.save_tasks()
+    
+    def create_backup(self) -> str:
+        """
+        Back up the task file, folding the journal into it first so the
+        backup includes every change.
+        
+        Returns:
+            str: Path to the backup file
+        
+        Raises:
+            FileAccessError: If compaction or backup creation fails
+        """
+        self.compact()
+        return create_backup(self._file_path)
+    
+    def close(self) -> None:
+        """
+        Compact any pending journal entries and release the journal handle.
+        
+        Raises:
+            FileAccessError: If compaction fails
+        """
+        self.compact()
+        self._close_journal()
+    
+    def __del__(self) -> None:
+        # Entries left in the journal are replayed on next load, so only the
+        # handle needs releasing here
+        try:
+            self._close_journal()
+        except Exception:
+            pass
+    
+    def _append_journal(self, op: str, task: Task) -> bool:
+        """
+        Durably append a single mutation record to the journal.
+        
+        Args:
+            op: Operation name ('add' or 'update')
+            task: Task the operation applies to
+            
+        Returns:
+            bool: True if the record was written
+            
+        Raises:
+            FileAccessError: If journal write fails
+        """
+        try:
+            if self._journal_fh is None:
+                fd = os.open(self._journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, JOURNAL_PERMISSIONS)
+                self._journal_fh = os.fdopen(fd, 'ab')
+            fh = self._journal_fh
+            fh.write(encode_json({"op": op, "task": task._as_dict()}) + b"\n")
+            fh.flush()
+            _sync_journal(fh.fileno())
+        except OSError as e:
+            logger.error(f"Failed to write journal: {str(e)}")
+            raise FileAccessError(f"Unable to write file: {self._journal_path}")
+        
+        if fh.tell() >= JOURNAL_MAX_SIZE:
+            return self.compact()
+        return True
+    
+    def _replay_journal(self) -> None:
+        """
+        Apply journaled mutations on top of the tasks loaded from the task file.
+        
+        Records are applied as upserts by task ID, so replaying entries that a
+        save already folded in is harmless. A torn final line from an
+        interrupted write is ignored.
+        
+        Raises:
+            FileAccessError: If journal read fails
+            DataCorruptionError: If a journal record is invalid
+        """
+        try:
+            with open(self._journal_path, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error(f"Failed to read journal: {str(e)}")
+            raise FileAccessError(f"Unable to read file: {self._journal_path}")
+        
+        last = len(lines) - 1
+        for lineno, line in enumerate(lines):
+            try:
+                record = decode_json(line)
+                if record["op"] not in ("add", "update"):
+                    raise ValueError(f"Unknown journal operation: {record['op']}")
+                task = Task._from_trusted_dict(record["task"])
+            except (ValueError, KeyError, TypeError, TaskValidationError) as e:
+                if lineno == last:
+                    logger.warning(f"Ignoring incomplete journal entry: {str(e)}")
+                    break
+                raise DataCorruptionError(f"Invalid journal entry on line {lineno + 1}")
+            
+            i = self._index.get(task.id)
+            if i is None:
+                self._index[task.id] = len(self._tasks)
+                self._tasks.append(task)
+            else:
+                self._tasks[i] = task
+            self._dirty = True
+    
+    def _truncate_journal(self) -> None:
+        """
+        Discard journal entries once they are reflected in the task file.
+        """
+        self._close_journal()
+        try:
+            os.unlink(self._journal_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to truncate journal: {str(e)}")
+            raise FileAccessError(f"Unable to write file: {self._journal_path}")
+    
+    def _close_journal(self) -> None:
+        """
+        Close the journal handle if one is open.
+        """
+        if self._journal_fh is not None:
+            self._journal_fh.close()
+            self._journal_fh = None
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer persistence of mutations until the outermost batch exits.
+        
+        Adds and updates inside the block are kept in memory only and written
+        with a single full save on exit, instead of one synced journal entry
+        each. Batches may be nested.
+        
+        Raises:
+            FileAccessError: If the final save fails
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save_tasks()
+    
+    @contextmanager
+    def transaction(self, task_id: int) -> Iterator[None]:
+        """
+        Roll back a single-task write if the enclosed block fails.
+        
+        Only the task with task_id (as its dictionary form, so changes made to
+        it in place are undone too) and the metadata are snapshotted on entry,
+        so entering a transaction does not depend on the number of tasks.
+        Writes inside the block persist as usual; if the block raises an
+        Exception, the task is restored, or removed if the block added it,
+        and the restored state is saved in full (discarding the block's
+        journal entries) before the exception propagates.
+        
+        Args:
+            task_id: ID of the task the block adds or updates
+        
+        Raises:
+            FileAccessError: If persisting the restored state fails
+        """
+        i = self._index.get(task_id)
+        # _as_dict() memos are replaced, never mutated, on attribute writes
+        task_snapshot = self._tasks[i]._as_dict() if i is not None else None
+        metadata_snapshot = dict(self._metadata)
+        try:
+            yield
+        except Exception:
+            i = self._index.get(task_id)
+            if task_snapshot is not None:
+                self._tasks[i] = Task._from_trusted_dict(task_snapshot)
+            elif i is not None:
+                # Added inside the block; adds append, so this is the last task
+                del self._tasks[i]
+                del self._index[task_id]
+                if i != len(self._tasks):
+                    self._index = {task.id: j for j, task in enumerate(self._tasks)}
+            self._metadata = metadata_snapshot
+            self._dirty = True
+            logger.warning("Storage transaction rolled back")
+            self.save_tasks()
+            raise
+    
     def add_task(self, task: Task) -> bool:
         """
         Add new task with validation and persistence.
@@ -144,8 +377,12 @@ class TaskStorage:
         if len(self._tasks) >= MAX_TASKS:
             raise ValueError(f"Task limit of {MAX_TASKS} exceeded")
             
+        self._index[task.id] = len(self._tasks)
         self._tasks.append(task)
-        return self.save_tasks()
+        self._dirty = True
+        if self._batch_depth:
+            return True
+        return self._append_journal("add", task)
     
     def get_task(self, task_id: int) -> Optional[Task]:
         """
@@ -157,10 +394,8 @@ class TaskStorage:
         Returns:
             Optional[Task]: Task if found, None otherwise
         """
-        for task in self._tasks:
-            if task.id == task_id:
-                return task
-        return None
+        i = self._index.get(task_id)
+        return self._tasks[i] if i is not None else None
     
     def update_task(self, task: Task) -> bool:
         """
@@ -176,17 +411,61 @@ class TaskStorage:
             ValueError: If task not found
             FileAccessError: If save fails
         """
-        for i, existing_task in enumerate(self._tasks):
-            if existing_task.id == task.id:
-                self._tasks[i] = task
-                return self.save_tasks()
-        raise ValueError(f"Task with ID {task.id} not found")
+        i = self._index.get(task.id)
+        if i is None:
+            raise ValueError(f"Task with ID {task.id} not found")
+        self._tasks[i] = task
+        self._dirty = True
+        if self._batch_depth:
+            return True
+        return self._append_journal("update", task)
+    
+    def replace_tasks(self, tasks: List[Task]) -> bool:
+        """
+        Replace the full task list and save it to the task file.
+        
+        Args:
+            tasks: Tasks to keep, in display order
+            
+        Returns:
+            bool: True if save successful
+            
+        Raises:
+            FileAccessError: If save fails
+        """
+        self._tasks = list(tasks)
+        self._index = {task.id: i for i, task in enumerate(self._tasks)}
+        self._dirty = True
+        return self.save_tasks()
+    
+    def prune_tasks(self, should_remove: Callable[[Task], bool]) -> int:
+        """
+        Remove matching tasks in place and save if any were removed.
+        
+        Args:
+            should_remove: Predicate returning True for tasks to drop
+            
+        Returns:
+            int: Number of tasks removed
+            
+        Raises:
+            FileAccessError: If save fails
+        """
+        tasks = self._tasks
+        initial_count = len(tasks)
+        tasks[:] = [task for task in tasks if not should_remove(task)]
+        removed_count = initial_count - len(tasks)
+        if removed_count:
+            self._index = {task.id: i for i, task in enumerate(tasks)}
+            self._dirty = True
+            self.save_tasks()
+        return removed_count
     
-    def get_all_tasks(self) -> List[Task]:
+    def get_all_tasks(self) -> Tuple[Task, ...]:
         """
         Retrieve all tasks with optional filtering.
         
         Returns:
-            List[Task]: List of all tasks
+            Tuple[Task, ...]: Read-only snapshot of all tasks
         """
-        return self._tasks.copy()
\ No newline at end of file
+        return tuple(self._tasks)
\ No newline at end of file
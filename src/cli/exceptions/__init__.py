@@ -18,6 +18,7 @@ Python: 3.6+
 from .storage_exceptions import (
     StorageError,
     FileAccessError,
+    FileNotFoundStorageError,
     DataCorruptionError
 )
 
@@ -40,6 +41,7 @@ __all__ = [
     # Storage Exceptions (E001-E002)
     'StorageError',          # Base storage exception
     'FileAccessError',       # E001: File access issues
+    'FileNotFoundStorageError',  # E001: Storage file does not exist
     'DataCorruptionError',   # E002: Data corruption
 
     # Task Exceptions (E003, E005)
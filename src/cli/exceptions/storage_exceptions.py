@@ -18,6 +18,9 @@ class StorageError(Exception):
     message handling and error code support.
     """
     
+    # Slotted so raising does not allocate an instance __dict__
+    __slots__ = ('error_code',)
+    
     def __init__(self, message: str) -> None:
         """
         Initialize the base storage error with a sanitized message.
@@ -41,6 +44,8 @@ class FileAccessError(StorageError):
     Error code: E001
     """
     
+    __slots__ = ()
+    
     def __init__(self, message: str) -> None:
         """
         Initialize file access error with error code E001.
@@ -52,6 +57,19 @@ class FileAccessError(StorageError):
         self.error_code = 'E001'  # Specific error code for file access issues
 
 
+class FileNotFoundStorageError(FileAccessError):
+    """
+    Exception raised when a storage file does not exist yet.
+    
+    Lets callers tell a missing file (first run) apart from other access
+    failures without a separate existence check before opening.
+    
+    Error code: E001
+    """
+    
+    __slots__ = ()
+
+
 class DataCorruptionError(StorageError):
     """
     Exception raised when data file corruption is detected.
@@ -64,6 +82,8 @@ class DataCorruptionError(StorageError):
     Error code: E002
     """
     
+    __slots__ = ()
+    
     def __init__(self, message: str) -> None:
         """
         Initialize data corruption error with error code E002.
@@ -19,6 +19,8 @@ class TaskError(Exception):
         message (str): Sanitized error message for user display
     """
     
+    __slots__ = ('message',)
+    
     def __init__(self, message: str) -> None:
         """
         Initialize the base task error with a sanitized error message.
@@ -26,8 +28,12 @@ class TaskError(Exception):
         Args:
             message (str): Error message to display to user
         """
-        # Sanitize message by stripping any system-specific information
-        sanitized_message = str(message).replace('\n', ' ').strip()
+        # Sanitize message by stripping any system-specific information;
+        # already-clean literal messages are used as-is
+        if type(message) is str and '\n' not in message and message == message.strip():
+            sanitized_message = message
+        else:
+            sanitized_message = str(message).replace('\n', ' ').strip()
         super().__init__(sanitized_message)
         self.message = sanitized_message
 
@@ -41,6 +47,8 @@ class TaskNotFoundError(TaskError):
         error_code (str): Standard error code E003
     """
     
+    __slots__ = ('error_code',)
+    
     def __init__(self, task_id: int) -> None:
         """
         Initialize task not found error with task ID and error code E003.
@@ -62,6 +70,8 @@ class TaskLimitError(TaskError):
         error_code (str): Standard error code E005
     """
     
+    __slots__ = ('error_code',)
+    
     def __init__(self, limit: int) -> None:
         """
         Initialize task limit error with maximum limit and error code E005.
@@ -82,6 +92,8 @@ class TaskValidationError(TaskError):
         message (str): Sanitized validation error message
     """
     
+    __slots__ = ()
+    
     def __init__(self, message: str) -> None:
         """
         Initialize task validation error with specific validation failure message.
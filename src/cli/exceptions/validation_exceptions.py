@@ -12,6 +12,9 @@ from ..types.custom_types import TaskId, TaskStatus
 class ValidationError(Exception):
     """Base exception class for all validation-related errors in the application."""
     
+    # Attributes live in slots so raising does not allocate an instance __dict__
+    __slots__ = ('message', 'error_code')
+    
     def __init__(self, message: str, error_code: str) -> None:
         """
         Initialize validation error with message and error code.
@@ -28,6 +31,15 @@ class ValidationError(Exception):
 class TaskDescriptionValidationError(ValidationError):
     """Exception raised when task description validation fails."""
     
+    __slots__ = ()
+    
+    # Validation rules and recovery action, prebuilt once per class
+    _SUFFIX = (
+        "\nTask description must be between 1 and 200 characters and contain "
+        "only alphanumeric characters and basic punctuation."
+        "\nPlease revise your task description and try again."
+    )
+    
     def __init__(self, message: str) -> None:
         """
         Initialize task description validation error.
@@ -35,18 +47,19 @@ class TaskDescriptionValidationError(ValidationError):
         Args:
             message (str): Specific validation error message
         """
-        validation_rules = (
-            "Task description must be between 1 and 200 characters and contain "
-            "only alphanumeric characters and basic punctuation."
-        )
-        recovery_action = "Please revise your task description and try again."
-        full_message = f"{message}\n{validation_rules}\n{recovery_action}"
-        super().__init__(full_message, "E001")
+        super().__init__(message + self._SUFFIX, "E001")
 
 
 class MenuOptionValidationError(ValidationError):
     """Exception raised when menu option validation fails."""
     
+    __slots__ = ()
+    
+    _SUFFIX = (
+        "\nMenu options must be a number between 1 and 4."
+        "\nPlease enter a valid menu option number."
+    )
+    
     def __init__(self, message: str) -> None:
         """
         Initialize menu option validation error.
@@ -54,15 +67,16 @@ class MenuOptionValidationError(ValidationError):
         Args:
             message (str): Specific validation error message
         """
-        validation_rules = "Menu options must be a number between 1 and 4."
-        recovery_action = "Please enter a valid menu option number."
-        full_message = f"{message}\n{validation_rules}\n{recovery_action}"
-        super().__init__(full_message, "E002")
+        super().__init__(message + self._SUFFIX, "E002")
 
 
 class TaskNumberValidationError(ValidationError):
     """Exception raised when task number validation fails."""
     
+    __slots__ = ('max_tasks',)
+    
+    _RECOVERY_SUFFIX = ".\nPlease enter a valid task number from the list."
+    
     def __init__(self, message: str, max_tasks: int) -> None:
         """
         Initialize task number validation error.
@@ -72,7 +86,8 @@ class TaskNumberValidationError(ValidationError):
             max_tasks (int): Maximum number of available tasks
         """
         self.max_tasks = max_tasks
-        validation_rules = f"Task number must be between 1 and {max_tasks}."
-        recovery_action = "Please enter a valid task number from the list."
-        full_message = f"{message}\n{validation_rules}\n{recovery_action}"
+        full_message = (
+            message + "\nTask number must be between 1 and " + str(max_tasks)
+            + self._RECOVERY_SUFFIX
+        )
         super().__init__(full_message, "E003")
\ No newline at end of file
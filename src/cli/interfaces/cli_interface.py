@@ -10,19 +10,25 @@ Python: 3.6+
 
 import sys  # version: 3.6+
 import time  # version: 3.6+
-from typing import Dict, Any, Optional  # version: 3.6+
+from typing import Dict, Any, Final, List, Optional  # version: 3.6+
 
+from ..config.settings import Settings
 from ..core.task_manager import TaskManager, TaskValidationError, TaskStorageError
+from ..models.task import Task
 from .menu_interface import MenuInterface
 
 # Performance thresholds in milliseconds
 MENU_RESPONSE_THRESHOLD = 100
 OPERATION_TIMEOUT = 500
+_MENU_RESPONSE_THRESHOLD_NS = MENU_RESPONSE_THRESHOLD * 1_000_000
 
 # Exit codes
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
 
+# Timing samples are only taken for debug runs; read once at import
+_PERF_ENABLED: Final[bool] = Settings.default().metrics_enabled
+
 class CLIInterface:
     """
     Main CLI interface class that coordinates user interaction and task management
@@ -40,6 +46,12 @@ class CLIInterface:
         self._task_manager = TaskManager(storage_path)
         self._menu_interface = MenuInterface()
         self._running = False
+        # perf_counter_ns() at the start of run(); None unless _PERF_ENABLED
+        self._start_ns: Optional[int] = None
+
+        # Task list as last read from the task manager, updated write-through
+        # on add; None until the first view
+        self._tasks_cache: Optional[List[Task]] = None
 
         # Initialize monitoring
         self._performance_metrics: Dict[str, float] = {
@@ -64,20 +76,22 @@ class CLIInterface:
             int: Exit code (0 for success, 1 for failure)
         """
         self._running = True
-        start_time = time.time()
+        if _PERF_ENABLED:
+            self._start_ns = time.perf_counter_ns()
 
         try:
             while self._running:
-                # Start operation timer
-                operation_start = time.time()
-
                 # Display menu and get user choice
-                choice = self._menu_interface.display_menu()
-                menu_response_time = (time.time() - operation_start) * 1000
+                if _PERF_ENABLED:
+                    operation_start = time.perf_counter_ns()
+                    choice = self._menu_interface.display_menu()
+                    elapsed_ns = time.perf_counter_ns() - operation_start
 
-                # Monitor menu response time
-                if menu_response_time > MENU_RESPONSE_THRESHOLD:
-                    self._performance_metrics['menu_response'] = menu_response_time
+                    # Monitor menu response time; convert to ms only when recorded
+                    if elapsed_ns > _MENU_RESPONSE_THRESHOLD_NS:
+                        self._performance_metrics['menu_response'] = elapsed_ns / 1e6
+                else:
+                    choice = self._menu_interface.display_menu()
 
                 # Handle menu selection
                 try:
@@ -102,7 +116,7 @@ class CLIInterface:
                     self._menu_interface.show_message(f"An error occurred: {str(e)}", 'error')
 
             # Record total runtime
-            self._performance_metrics['total_runtime'] = time.time() - start_time
+            self._record_total_runtime()
             return EXIT_SUCCESS
 
         except KeyboardInterrupt:
@@ -116,7 +130,7 @@ class CLIInterface:
         """
         Handle task addition workflow with input validation and error handling.
         """
-        operation_start = time.time()
+        operation_start = time.perf_counter_ns() if _PERF_ENABLED else 0
 
         try:
             # Get task description from user
@@ -126,10 +140,12 @@ class CLIInterface:
 
             # Create task
             task = self._task_manager.create_task(description)
+            if self._tasks_cache is not None:
+                self._tasks_cache.append(task)
             
             # Update metrics
-            operation_time = (time.time() - operation_start) * 1000
-            self._performance_metrics['task_operations'] = operation_time
+            if _PERF_ENABLED:
+                self._performance_metrics['task_operations'] = (time.perf_counter_ns() - operation_start) / 1e6
             self._session_state['tasks_added'] += 1
 
             # Show success message
@@ -142,18 +158,18 @@ class CLIInterface:
         """
         Handle task viewing workflow with performance monitoring.
         """
-        operation_start = time.time()
+        operation_start = time.perf_counter_ns() if _PERF_ENABLED else 0
 
         try:
             # Get all tasks
-            tasks = self._task_manager.get_all_tasks()
+            tasks = self._get_tasks_cached()
             
             # Display tasks
             self._menu_interface.display_task_list(tasks)
 
             # Update metrics
-            operation_time = (time.time() - operation_start) * 1000
-            self._performance_metrics['task_operations'] = operation_time
+            if _PERF_ENABLED:
+                self._performance_metrics['task_operations'] = (time.perf_counter_ns() - operation_start) / 1e6
 
         except Exception as e:
             raise TaskStorageError(f"Failed to retrieve tasks: {str(e)}")
@@ -162,26 +178,35 @@ class CLIInterface:
         """
         Handle task completion workflow with validation and error handling.
         """
-        operation_start = time.time()
+        operation_start = time.perf_counter_ns() if _PERF_ENABLED else 0
 
         try:
             # Get all tasks
-            tasks = self._task_manager.get_all_tasks()
+            tasks = self._get_tasks_cached()
             if not tasks:
                 self._menu_interface.show_message("No tasks available", 'info')
                 return
 
-            # Get task selection from user
-            task_number = self._menu_interface.display_completion_menu(tasks)
-            if task_number == 0:  # User cancelled
+            # Get task selection from user among the pending tasks
+            task_id = self._menu_interface.display_completion_menu(
+                self._task_manager.get_pending_tasks())
+            if task_id == 0:  # User cancelled
                 return
 
             # Complete selected task
-            self._task_manager.complete_task(task_number)
+            self._task_manager.complete_task(task_id)
+
+            # Write-through: swap the completed task into the cached list
+            if self._tasks_cache is not None:
+                completed = self._task_manager.get_task(task_id)
+                for i, cached in enumerate(self._tasks_cache):
+                    if cached.id == task_id:
+                        self._tasks_cache[i] = completed
+                        break
             
             # Update metrics
-            operation_time = (time.time() - operation_start) * 1000
-            self._performance_metrics['task_operations'] = operation_time
+            if _PERF_ENABLED:
+                self._performance_metrics['task_operations'] = (time.perf_counter_ns() - operation_start) / 1e6
             self._session_state['tasks_completed'] += 1
 
             # Show success message
@@ -190,14 +215,35 @@ class CLIInterface:
         except Exception as e:
             raise TaskValidationError(f"Failed to complete task: {str(e)}")
 
+    def _get_tasks_cached(self) -> List[Task]:
+        """
+        Return all tasks, reading from the task manager only on first use.
+
+        Returns:
+            List[Task]: Shallow copy of the cached task list
+        """
+        if self._tasks_cache is None:
+            self._tasks_cache = list(self._task_manager.get_all_tasks())
+        return list(self._tasks_cache)
+
+    def _record_total_runtime(self) -> None:
+        """
+        Record seconds elapsed since run() started, when timing is enabled.
+        """
+        if self._start_ns is not None:
+            self._performance_metrics['total_runtime'] = (time.perf_counter_ns() - self._start_ns) / 1e9
+
     def handle_exit(self) -> None:
         """
         Handle application exit with cleanup.
         """
         self._running = False
         
+        # Fold this session's journaled writes into the task file
+        self._task_manager.close()
+        
         # Save final metrics
-        self._performance_metrics['total_runtime'] = time.time() - time.time()
+        self._record_total_runtime()
         
         # Show exit message
         self._menu_interface.show_message("Thank you for using Simple To-Do List App", 'info')
\ No newline at end of file
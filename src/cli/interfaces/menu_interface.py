@@ -7,7 +7,10 @@ error handling, input validation, and consistent layout formatting according to
 Version: 1.0
 """
 
-from typing import List, Optional, Dict, Any  # version: 3.6+
+import io
+import sys
+from contextlib import redirect_stdout
+from typing import List, Optional, Dict, Any, Sequence, Tuple  # version: 3.6+
 
 from ..models.task import Task
 from ..utils.output_utils import (
@@ -34,6 +37,23 @@ from ..constants.messages import (
 APP_TITLE = "Simple To-Do List App"
 MAX_DISPLAY_TASKS = 10
 INPUT_TIMEOUT = 30  # seconds
+RENDER_CACHE_SIZE = 16  # rendered task-list pages kept between views
+
+# Static screen text, joined once so each display is a single write
+_MENU_BLOCK = '\n'.join((
+    MENU_MESSAGES['add_task'],
+    MENU_MESSAGES['view_tasks'],
+    MENU_MESSAGES['complete_task'],
+    MENU_MESSAGES['exit'],
+    MENU_MESSAGES['divider']
+)) + '\n'
+_TASK_INPUT_GUIDELINES = '\n'.join((
+    "Guidelines:",
+    "- Maximum 200 characters",
+    "- Alphanumeric characters and basic punctuation only",
+    "- Press [Enter] to submit, [Esc] to cancel",
+    MENU_MESSAGES['divider']
+)) + '\n'
 
 class MenuInterface:
     """
@@ -50,6 +70,9 @@ class MenuInterface:
             'input_buffer': '',
             'display_mode': 'normal'
         }
+        # Rendered task-list pages keyed by (task ids and statuses, page);
+        # the key changes whenever a task is added or completed
+        self._render_cache: Dict[Tuple[Any, ...], str] = {}
         
         # Clear screen and initialize interface
         clear_screen()
@@ -73,30 +96,25 @@ class MenuInterface:
         Returns:
             int: Validated menu option (1-4)
         """
-        try:
-            clear_screen()
-            print_header(APP_TITLE)
-            
-            # Display menu options
-            for message in [
-                MENU_MESSAGES['add_task'],
-                MENU_MESSAGES['view_tasks'],
-                MENU_MESSAGES['complete_task'],
-                MENU_MESSAGES['exit']
-            ]:
-                print(message)
-            
-            print(MENU_MESSAGES['divider'])
-            
-            # Get and validate user input
-            return get_menu_option()
-            
-        except KeyboardInterrupt:
-            print_message(INFO_MESSAGES['confirm_exit'], 'info')
-            return 4  # Exit option
-        except Exception as e:
-            print_message(str(e), 'error')
-            return self.display_menu()
+        # Retry in a loop rather than recursing, so repeated bad input
+        # cannot exhaust the stack
+        while True:
+            try:
+                clear_screen()
+                print_header(APP_TITLE)
+                
+                # Display menu options
+                sys.stdout.write(_MENU_BLOCK)
+                
+                # Get and validate user input
+                return get_menu_option()
+                
+            except (KeyboardInterrupt, EOFError):
+                # End of input cannot be retried; treat it like an interrupt
+                print_message(INFO_MESSAGES['confirm_exit'], 'info')
+                return 4  # Exit option
+            except Exception as e:
+                print_message(str(e), 'error')
     
     def display_task_input(self) -> str:
         """
@@ -105,32 +123,28 @@ class MenuInterface:
         Returns:
             str: Sanitized and validated task description
         """
-        try:
-            clear_screen()
-            print_header("Add New Task")
-            
-            # Display input guidelines
-            print("Guidelines:")
-            print("- Maximum 200 characters")
-            print("- Alphanumeric characters and basic punctuation only")
-            print("- Press [Enter] to submit, [Esc] to cancel")
-            print(MENU_MESSAGES['divider'])
-            
-            # Get and validate task description
-            return get_task_description()
-            
-        except KeyboardInterrupt:
-            return ''
-        except Exception as e:
-            print_message(str(e), 'error')
-            return self.display_task_input()
+        while True:
+            try:
+                clear_screen()
+                print_header("Add New Task")
+                
+                # Display input guidelines
+                sys.stdout.write(_TASK_INPUT_GUIDELINES)
+                
+                # Get and validate task description
+                return get_task_description()
+                
+            except (KeyboardInterrupt, EOFError):
+                return ''
+            except Exception as e:
+                print_message(str(e), 'error')
     
-    def display_task_list(self, tasks: List[Task], page_number: Optional[int] = None) -> None:
+    def display_task_list(self, tasks: Sequence[Task], page_number: Optional[int] = None) -> None:
         """
         Display paginated list of tasks with security checks.
         
         Args:
-            tasks: List[Task]: Tasks to display
+            tasks: Sequence[Task]: Tasks to display
             page_number: Optional[int]: Page number to display
         """
         try:
@@ -140,45 +154,66 @@ class MenuInterface:
                 self._current_page = max(1, min(page_number, self._total_pages))
             
             clear_screen()
-            print_task_list(tasks, self.current_page)
+            sys.stdout.write(self._render_task_list(tasks, self.current_page))
             wait_for_enter()
             
         except Exception as e:
             print_message(str(e), 'error')
             wait_for_enter()
     
-    def display_completion_menu(self, tasks: List[Task]) -> int:
+    def _render_task_list(self, tasks: Sequence[Task], page_number: int) -> str:
         """
-        Display task completion menu with secure selection.
+        Return the task list page as text, reusing the last render if unchanged.
         
         Args:
-            tasks: List[Task]: Available tasks
+            tasks: Sequence[Task]: Tasks to render
+            page_number: int: Page number to render
             
         Returns:
-            int: Validated task ID
+            str: Rendered page exactly as print_task_list would print it
         """
-        try:
-            clear_screen()
-            print_header("Mark Task as Complete")
+        key = (tuple([(task.id, task.status) for task in tasks]), page_number)
+        rendered = self._render_cache.get(key)
+        if rendered is None:
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                print_task_list(tasks, page_number)
+            rendered = buffer.getvalue()
+            if len(self._render_cache) >= RENDER_CACHE_SIZE:
+                self._render_cache.clear()
+            self._render_cache[key] = rendered
+        return rendered
+    
+    def display_completion_menu(self, pending_tasks: Sequence[Task]) -> int:
+        """
+        Display task completion menu with secure selection.
+        
+        Args:
+            pending_tasks: Sequence[Task]: Tasks that can be completed
             
-            # Display only pending tasks
-            pending_tasks = [task for task in tasks if not task.completed]
-            if not pending_tasks:
-                print_message(INFO_MESSAGES['no_tasks'], 'info')
-                wait_for_enter()
+        Returns:
+            int: Validated task ID, or 0 if cancelled
+        """
+        while True:
+            try:
+                clear_screen()
+                print_header("Mark Task as Complete")
+                
+                if not pending_tasks:
+                    print_message(INFO_MESSAGES['no_tasks'], 'info')
+                    wait_for_enter()
+                    return 0
+                
+                print_task_list(pending_tasks)
+                print(MENU_MESSAGES['divider'])
+                
+                # Get and validate task selection; numbers are list positions
+                return pending_tasks[get_task_number(len(pending_tasks)) - 1].id
+                
+            except (KeyboardInterrupt, EOFError):
                 return 0
-            
-            print_task_list(pending_tasks)
-            print(MENU_MESSAGES['divider'])
-            
-            # Get and validate task selection
-            return get_task_number(len(pending_tasks))
-            
-        except KeyboardInterrupt:
-            return 0
-        except Exception as e:
-            print_message(str(e), 'error')
-            return self.display_completion_menu(tasks)
+            except Exception as e:
+                print_message(str(e), 'error')
     
     def show_message(self, message: str, message_type: str = 'info',
                     wait_for_input: bool = True) -> None:
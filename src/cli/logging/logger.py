@@ -20,6 +20,19 @@ LOG_FILE_PATH = os.path.join(FILE_SETTINGS['DATA_DIR'], 'logs', 'todo.log')
 MAX_LOG_SIZE = 1048576  # 1MB maximum log file size
 BACKUP_COUNT = 1  # Keep one backup file
 
+class _SecureRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that creates log files with restricted permissions.
+    
+    Files are opened lazily on the first record, with the mode applied at
+    creation instead of by a separate chmod.
+    """
+    
+    def _open(self):
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                     FILE_SETTINGS['FILE_PERMISSIONS'])
+        return os.fdopen(fd, self.mode, encoding=self.encoding)
+
 def setup_logging() -> logging.Logger:
     """
     Initializes and configures the application logger with appropriate handlers
@@ -28,13 +41,11 @@ def setup_logging() -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance with console and file handlers
     """
-    # Create logs directory if it doesn't exist
+    # Create logs directory if it doesn't exist; owner-only, with the
+    # execute bit directories need
     log_dir = os.path.dirname(LOG_FILE_PATH)
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir, mode=FILE_SETTINGS['FILE_PERMISSIONS'])
-    
-    # Set appropriate permissions on existing log directory
-    os.chmod(log_dir, FILE_SETTINGS['FILE_PERMISSIONS'])
+    if not os.path.isdir(log_dir):
+        os.makedirs(log_dir, mode=0o700, exist_ok=True)
 
     # Create and configure logger
     logger = logging.getLogger(APP_SETTINGS['APP_NAME'])
@@ -49,12 +60,13 @@ def setup_logging() -> logging.Logger:
     console_handler.setLevel(logging.DEBUG if APP_SETTINGS['DEBUG'] else logging.ERROR)
 
     # Create rotating file handler with secure permissions
-    file_handler = RotatingFileHandler(
+    file_handler = _SecureRotatingFileHandler(
         filename=LOG_FILE_PATH,
         maxBytes=MAX_LOG_SIZE,
         backupCount=BACKUP_COUNT,
         mode='a',
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setLevel(logging.ERROR)  # Always log errors to file
 
@@ -63,10 +75,6 @@ def setup_logging() -> logging.Logger:
     console_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
 
-    # Set secure permissions on log file
-    if os.path.exists(LOG_FILE_PATH):
-        os.chmod(LOG_FILE_PATH, FILE_SETTINGS['FILE_PERMISSIONS'])
-
     # Add handlers to logger
     logger.addHandler(console_handler)
     logger.addHandler(file_handler)
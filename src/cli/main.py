@@ -9,24 +9,27 @@ Python: 3.6+
 
 import os  # version: 3.6+
 import sys  # version: 3.6+
-import signal  # version: 3.6+
 import time  # version: 3.6+
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from .interfaces.cli_interface import CLIInterface
 from .config.settings import load_config, get_config
-from .logging.logger import get_logger
 from .exceptions.storage_exceptions import FileAccessError
 from .constants.messages import ERROR_MESSAGES, INFO_MESSAGES
 
+# The interface and logging stacks are imported inside main() once the
+# configuration has loaded, so failed or trivial invocations skip them
+if TYPE_CHECKING:
+    from .interfaces.cli_interface import CLIInterface
+
 # Constants for application initialization
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
 DEFAULT_PERMISSIONS = 0o600
 STARTUP_TIMEOUT = 5000  # milliseconds
+_STARTUP_TIMEOUT_NS = STARTUP_TIMEOUT * 1_000_000
 
 # Global variables for cleanup
-cli_interface: Optional[CLIInterface] = None
+cli_interface: Optional['CLIInterface'] = None
 logger = None
 
 def signal_handler(signum: int, frame) -> None:
@@ -71,7 +74,7 @@ def setup_data_directory() -> bool:
         logger.error(f"Failed to setup data directory: {str(e)}")
         return False
 
-def cleanup(interface: CLIInterface) -> None:
+def cleanup(interface: 'CLIInterface') -> None:
     """
     Performs cleanup operations before application exit.
     
@@ -104,11 +107,12 @@ def main() -> int:
     
     try:
         # Set up signal handlers
+        import signal  # version: 3.6+
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
         
         # Start startup timer
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Load configuration
         config = load_config()
@@ -117,6 +121,7 @@ def main() -> int:
             return EXIT_FAILURE
             
         # Initialize logger
+        from .logging.logger import get_logger
         logger = get_logger()
         logger.info("Application startup initiated")
         
@@ -126,11 +131,12 @@ def main() -> int:
             return EXIT_FAILURE
             
         # Check startup time
-        startup_time = (time.time() - start_time) * 1000
-        if startup_time > STARTUP_TIMEOUT:
-            logger.warning(f"Slow startup detected: {startup_time:.2f}ms")
+        startup_ns = time.perf_counter_ns() - start_ns
+        if startup_ns > _STARTUP_TIMEOUT_NS:
+            logger.warning(f"Slow startup detected: {startup_ns / 1e6:.2f}ms")
             
         # Initialize CLI interface
+        from .interfaces.cli_interface import CLIInterface
         storage_path = os.path.join(config['DATA_DIR'], config['TASKS_FILE'])
         cli_interface = CLIInterface(storage_path)
         
@@ -10,10 +10,20 @@ Version: 1.0
 from datetime import datetime
 from dataclasses import dataclass
 import re
+import sys
 
 from ..types.custom_types import TaskId, TaskStatus, TaskDict
 from ..exceptions.task_exceptions import TaskValidationError
 
+# Canonical (interned) status strings; every status assigned to or loaded
+# into a Task is mapped onto these, so equal statuses share one object
+STATUS_PENDING = sys.intern('pending')
+STATUS_COMPLETED = sys.intern('completed')
+VALID_STATUSES = frozenset((STATUS_PENDING, STATUS_COMPLETED))
+_CANONICAL_STATUS = {status: status for status in VALID_STATUSES}
+
+_DESCRIPTION_RE = re.compile(r'[\w\s.,!?-]+')
+
 @dataclass
 class Task:
     """
@@ -27,6 +37,10 @@ class Task:
         modified (datetime): UTC timestamp of last modification
     """
     
+    # No per-instance __dict__; the manager caches up to 1000 tasks.
+    # _cached_dict memoizes _as_dict() and is cleared on any attribute write.
+    __slots__ = ('id', 'description', 'status', 'created', 'modified', '_cached_dict')
+    
     id: TaskId
     description: str
     status: TaskStatus
@@ -37,7 +51,7 @@ class Task:
         self,
         id: TaskId,
         description: str,
-        status: TaskStatus = 'pending',
+        status: TaskStatus = STATUS_PENDING,
         created: datetime = None,
         modified: datetime = None
     ) -> None:
@@ -66,6 +80,15 @@ class Task:
         # Perform comprehensive validation
         self.validate()
     
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Set an attribute and invalidate the memoized dictionary form.
+        """
+        if name == 'status':
+            value = _CANONICAL_STATUS.get(value, value)
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_cached_dict', None)
+    
     def validate(self) -> bool:
         """
         Perform comprehensive validation of task data with secure error handling.
@@ -87,11 +110,11 @@ class Task:
             raise TaskValidationError("Description must be a string")
         if not 1 <= len(self.description) <= 200:
             raise TaskValidationError("Description must be between 1 and 200 characters")
-        if not re.match(r'^[\w\s.,!?-]+$', self.description):
+        if not _DESCRIPTION_RE.fullmatch(self.description):
             raise TaskValidationError("Description contains invalid characters")
             
         # Validate status
-        if self.status not in ('pending', 'completed'):
+        if self.status not in VALID_STATUSES:
             raise TaskValidationError("Invalid task status")
             
         # Validate timestamps
@@ -107,15 +130,31 @@ class Task:
         Convert task to dictionary with secure data handling.
         
         Returns:
-            TaskDict: Secure dictionary representation of task
-        """
-        return {
-            'id': self.id,
-            'description': self.description,
-            'status': self.status,
-            'created': self.created.isoformat(),
-            'modified': self.modified.isoformat()
-        }
+            TaskDict: Secure dictionary representation of task, owned by the caller
+        """
+        return dict(self._as_dict())
+    
+    def _as_dict(self) -> TaskDict:
+        """
+        Return the memoized dictionary form shared with storage.
+        
+        The memo is replaced, never mutated, when the task is modified, so
+        storage can keep it as a snapshot. Callers must not modify it.
+        
+        Returns:
+            TaskDict: Shared dictionary representation of task
+        """
+        cached = self._cached_dict
+        if cached is None:
+            cached = {
+                'id': self.id,
+                'description': self.description,
+                'status': self.status,
+                'created': self.created.isoformat(),
+                'modified': self.modified.isoformat()
+            }
+            object.__setattr__(self, '_cached_dict', cached)
+        return cached
     
     @classmethod
     def from_dict(cls, data: TaskDict) -> 'Task':
@@ -144,13 +183,54 @@ class Task:
             return cls(
                 id=data['id'],
                 description=data['description'],
-                status=data['status'],
+                status=_CANONICAL_STATUS.get(data['status'], data['status']),
                 created=created,
                 modified=modified
             )
         except (ValueError, TypeError) as e:
             raise TaskValidationError(f"Invalid task data format: {str(e)}")
     
+    @classmethod
+    def _from_trusted_dict(cls, data: TaskDict) -> 'Task':
+        """
+        Create task from a dictionary this application wrote, skipping validate().
+        
+        Only for loading the application's own storage files; any external or
+        user-supplied data must go through from_dict.
+        
+        Args:
+            data (TaskDict): Dictionary previously produced by to_dict
+            
+        Returns:
+            Task: New task instance
+            
+        Raises:
+            TaskValidationError: If dictionary data is malformed
+        """
+        try:
+            status = _CANONICAL_STATUS.get(data['status'], data['status'])
+            created_iso = data['created']
+            modified_iso = data['modified']
+            task = object.__new__(cls)
+            set_field = object.__setattr__
+            set_field(task, 'id', data['id'])
+            set_field(task, 'description', data['description'])
+            set_field(task, 'status', status)
+            set_field(task, 'created', datetime.fromisoformat(created_iso))
+            set_field(task, 'modified', datetime.fromisoformat(modified_iso))
+            # Seed the _as_dict() memo with the stored ISO strings so saving an
+            # untouched task never re-formats its timestamps
+            set_field(task, '_cached_dict', {
+                'id': task.id,
+                'description': task.description,
+                'status': status,
+                'created': created_iso,
+                'modified': modified_iso
+            })
+            return task
+        except (KeyError, ValueError, TypeError) as e:
+            raise TaskValidationError(f"Invalid task data format: {str(e)}")
+    
     def mark_complete(self) -> None:
         """
         Mark task as completed with timestamp update.
@@ -158,6 +238,6 @@ class Task:
         Updates the task status to completed and sets the modified timestamp
         to the current UTC time.
         """
-        self.status = 'completed'
+        self.status = STATUS_COMPLETED
         self.modified = datetime.utcnow()
         self.validate()
\ No newline at end of file
@@ -13,7 +13,6 @@ import datetime  # version: 3.6+
 import argparse  # version: 3.6+
 
 from ..data.storage import TaskStorage
-from ..utils.file_utils import create_backup
 from ..logging.logger import get_logger
 from ..exceptions.storage_exceptions import FileAccessError
 
@@ -22,6 +21,40 @@ logger = get_logger()
 
 # Constants
 BACKUP_SUFFIX = ".bak"
+BACKUP_PERMISSIONS = 0o600
+COPY_CHUNK_SIZE = 65536
+
+def _copy_fd(src_fd: int, dst_fd: int, size: int) -> None:
+    """
+    Copies size bytes between file descriptors, in-kernel where supported.
+
+    Args:
+        src_fd: Descriptor open for reading at offset 0
+        dst_fd: Descriptor open for writing
+        size: Number of bytes to copy
+    """
+    offset = 0
+    sendfile = getattr(os, 'sendfile', None)
+    if sendfile is not None:
+        try:
+            while offset < size:
+                sent = sendfile(dst_fd, src_fd, offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+            return
+        except OSError:
+            # Platforms such as macOS only sendfile to sockets; finish with
+            # plain reads from wherever the kernel copy stopped
+            os.lseek(src_fd, offset, os.SEEK_SET)
+
+    while True:
+        chunk = os.read(src_fd, COPY_CHUNK_SIZE)
+        if not chunk:
+            break
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view):]
 
 def create_timestamped_backup(file_path: str) -> str:
     """
@@ -37,25 +70,33 @@ def create_timestamped_backup(file_path: str) -> str:
         FileAccessError: If backup creation fails
     """
     try:
-        # Validate source file exists
-        if not os.path.exists(file_path):
+        # Open source; a missing file is reported as such
+        try:
+            src_fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
             raise FileAccessError(f"Source file not found: {file_path}")
 
-        # Generate timestamp for backup file name
-        timestamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        backup_path = f"{file_path}_{timestamp}{BACKUP_SUFFIX}"
-
-        # Create backup with secure permissions
-        created_backup = create_backup(file_path)
-        if not created_backup:
-            raise FileAccessError("Backup creation failed")
-
-        # Rename backup with timestamp
-        os.rename(created_backup, backup_path)
-
-        # Verify backup file exists and has correct permissions
-        if not os.path.exists(backup_path):
-            raise FileAccessError("Backup file verification failed")
+        try:
+            # Generate timestamp for backup file name
+            timestamp = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            backup_path = f"{file_path}_{timestamp}{BACKUP_SUFFIX}"
+
+            # Create the backup directly under its final name; O_EXCL refuses
+            # to overwrite and the mode is applied at creation
+            dst_fd = os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, BACKUP_PERMISSIONS)
+            try:
+                _copy_fd(src_fd, dst_fd, os.fstat(src_fd).st_size)
+                os.fsync(dst_fd)
+            except OSError:
+                os.close(dst_fd)
+                dst_fd = -1
+                os.remove(backup_path)
+                raise
+            finally:
+                if dst_fd >= 0:
+                    os.close(dst_fd)
+        finally:
+            os.close(src_fd)
 
         logger.info(f"Successfully created backup: {backup_path}")
         return backup_path
@@ -81,8 +122,10 @@ def main() -> int:
     try:
         args = parser.parse_args()
         
-        # Initialize storage and validate file
+        # Initialize storage and validate file, then fold any journaled
+        # changes into the task file so the copy includes them
         storage = TaskStorage(args.file)
+        storage.close()
         
         # Create timestamped backup
         backup_path = create_timestamped_backup(args.file)
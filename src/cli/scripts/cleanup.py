@@ -8,8 +8,11 @@ Version: 1.0
 Python: 3.6+
 """
 
+import heapq
 import os
-from datetime import datetime, timedelta
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from ..logging.logger import get_logger
@@ -23,12 +26,19 @@ logger = get_logger()
 CLEANUP_INTERVAL_DAYS = 30  # Tasks older than this will be cleaned up
 MAX_BACKUP_FILES = 5  # Maximum number of backup files to retain
 
-def cleanup_old_tasks(storage: TaskStorage) -> int:
+def _cleanup_cutoff() -> datetime:
+    """
+    Returns the naive UTC cutoff before which items count as old.
+    """
+    return datetime.utcnow() - timedelta(days=CLEANUP_INTERVAL_DAYS)
+
+def cleanup_old_tasks(storage: TaskStorage, cutoff_date: Optional[datetime] = None) -> int:
     """
     Removes completed tasks older than the cleanup interval.
 
     Args:
         storage: TaskStorage instance for task operations
+        cutoff_date: Naive UTC cutoff; defaults to now minus the cleanup interval
 
     Returns:
         int: Number of tasks cleaned up
@@ -37,24 +47,16 @@ def cleanup_old_tasks(storage: TaskStorage) -> int:
         FileAccessError: If file operations fail
     """
     try:
-        tasks = storage.get_all_tasks()
-        cutoff_date = datetime.utcnow() - timedelta(days=CLEANUP_INTERVAL_DAYS)
-        initial_count = len(tasks)
+        if cutoff_date is None:
+            cutoff_date = _cleanup_cutoff()
 
-        # Filter tasks to keep
-        tasks_to_keep = [
-            task for task in tasks
-            if task.status != 'completed' or
-            datetime.fromisoformat(task.modified) > cutoff_date
-        ]
-
-        # Calculate number of removed tasks
-        removed_count = initial_count - len(tasks_to_keep)
+        # Drop old completed tasks in place; Task.modified is already a
+        # datetime, so no per-task parsing is needed
+        removed_count = storage.prune_tasks(
+            lambda task: task.status == 'completed' and task.modified <= cutoff_date
+        )
 
         if removed_count > 0:
-            # Update storage with filtered tasks
-            storage._tasks = tasks_to_keep
-            storage.save_tasks()
             logger.info(f"Cleaned up {removed_count} old completed tasks")
         else:
             logger.info("No old tasks to clean up")
@@ -65,10 +67,13 @@ def cleanup_old_tasks(storage: TaskStorage) -> int:
         logger.error(f"Task cleanup failed: {str(e)}")
         raise
 
-def cleanup_log_files() -> bool:
+def cleanup_log_files(cutoff_date: Optional[datetime] = None) -> bool:
     """
     Manages log file rotation and cleanup.
 
+    Args:
+        cutoff_date: Naive UTC cutoff; defaults to now minus the cleanup interval
+
     Returns:
         bool: True if cleanup successful
 
@@ -77,34 +82,45 @@ def cleanup_log_files() -> bool:
     """
     try:
         log_dir = os.path.join(DATA_DIR, 'logs')
-        if not os.path.exists(log_dir):
+        if cutoff_date is None:
+            cutoff_date = _cleanup_cutoff()
+        # Epoch seconds, comparable with st_mtime without building a datetime
+        # per file
+        cutoff_ts = cutoff_date.replace(tzinfo=timezone.utc).timestamp()
+        cleaned_count = 0
+
+        # Snapshot regular files first so rotated files are not revisited;
+        # DirEntry caches the file type from the directory read
+        try:
+            entries = os.scandir(log_dir)
+        except FileNotFoundError:
             logger.info("No log directory found")
             return True
+        with entries:
+            log_files = [entry for entry in entries if entry.is_file(follow_symlinks=False)]
 
-        cutoff_date = datetime.utcnow() - timedelta(days=CLEANUP_INTERVAL_DAYS)
-        cleaned_count = 0
-
-        for filename in os.listdir(log_dir):
-            file_path = os.path.join(log_dir, filename)
-            if not os.path.isfile(file_path):
-                continue
+        for entry in log_files:
+            file_path = entry.path
 
             # Check file size and age
-            stats = os.stat(file_path)
-            file_time = datetime.fromtimestamp(stats.st_mtime)
+            stats = entry.stat(follow_symlinks=False)
             
             if stats.st_size > MAX_FILE_SIZE:
-                # Rotate oversized log files
+                # Rotate oversized log files; os.replace overwrites any
+                # previous rotation and keeps the file mode, so chmod is
+                # only needed when the mode was wrong to begin with
                 backup_path = f"{file_path}.1"
-                if os.path.exists(backup_path):
-                    os.remove(backup_path)
-                os.rename(file_path, backup_path)
-                os.chmod(backup_path, FILE_PERMISSIONS)
+                os.replace(file_path, backup_path)
+                if stat.S_IMODE(stats.st_mode) != FILE_PERMISSIONS:
+                    os.chmod(backup_path, FILE_PERMISSIONS)
                 cleaned_count += 1
             
-            elif file_time < cutoff_date:
-                # Remove old log files
-                os.remove(file_path)
+            elif stats.st_mtime < cutoff_ts:
+                # Remove old log files; one already gone needs no cleanup
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    continue
                 cleaned_count += 1
 
         if cleaned_count > 0:
@@ -129,36 +145,45 @@ def cleanup_backup_files() -> bool:
         FileAccessError: If file operations fail
     """
     try:
-        if not os.path.exists(DATA_DIR):
+        try:
+            entries = os.scandir(DATA_DIR)
+        except FileNotFoundError:
             logger.info("No data directory found")
             return True
 
-        # Get list of backup files
-        backup_files = []
-        for filename in os.listdir(DATA_DIR):
-            if filename.endswith('.bak'):
-                file_path = os.path.join(DATA_DIR, filename)
-                stats = os.stat(file_path)
-                backup_files.append((file_path, stats.st_mtime))
-
-        # Sort by modification time (newest first)
-        backup_files.sort(key=lambda x: x[1], reverse=True)
-
-        # Remove excess backup files
+        # Single scan: keep a min-heap of the newest (mtime, path, mode)
+        # backups and remove whichever backup it displaces as soon as it is
+        # displaced
+        kept_files = []
         removed_count = 0
-        for file_path, _ in backup_files[MAX_BACKUP_FILES:]:
-            os.remove(file_path)
-            removed_count += 1
+        with entries:
+            for entry in entries:
+                if not (entry.name.endswith('.bak') and entry.is_file(follow_symlinks=False)):
+                    continue
+                stats = entry.stat(follow_symlinks=False)
+                backup = (stats.st_mtime, entry.path, stat.S_IMODE(stats.st_mode))
+                if len(kept_files) < MAX_BACKUP_FILES:
+                    heapq.heappush(kept_files, backup)
+                    continue
+                _, oldest_path, _ = heapq.heappushpop(kept_files, backup)
+                try:
+                    os.remove(oldest_path)
+                except FileNotFoundError:
+                    continue
+                removed_count += 1
 
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} excess backup files")
         else:
             logger.info("No backup files needed cleanup")
 
-        # Verify permissions on remaining backups
-        for file_path, _ in backup_files[:MAX_BACKUP_FILES]:
-            if os.path.exists(file_path):
-                os.chmod(file_path, FILE_PERMISSIONS)
+        # Fix permissions on remaining backups, using the modes from the scan
+        for _, file_path, mode in kept_files:
+            if mode != FILE_PERMISSIONS:
+                try:
+                    os.chmod(file_path, FILE_PERMISSIONS)
+                except FileNotFoundError:
+                    pass
 
         return True
 
@@ -180,20 +205,37 @@ def main() -> int:
         # Initialize storage
         storage = TaskStorage()
 
-        # Cleanup old tasks
+        # One cutoff shared by every cleanup step
+        cutoff_date = _cleanup_cutoff()
+
+        # Log rotation only touches the log directory, so it runs in the
+        # background. Task cleanup saves through create_backup, which writes
+        # tasks.json.bak into DATA_DIR, so the backup scan must wait for it.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            logs_future = executor.submit(cleanup_log_files, cutoff_date)
+
+            # Cleanup old tasks
+            try:
+                removed_tasks = cleanup_old_tasks(storage, cutoff_date)
+                logger.info(f"Task cleanup completed: {removed_tasks} tasks removed")
+            except Exception as e:
+                logger.error(f"Task cleanup failed: {str(e)}")
+                success = False
+
+            # Cleanup backup files once the task save has finished
+            try:
+                if not cleanup_backup_files():
+                    success = False
+            except Exception as e:
+                logger.error(f"Backup cleanup failed: {str(e)}")
+                success = False
+
+        # Cleanup log files; reports failure by returning False
         try:
-            removed_tasks = cleanup_old_tasks(storage)
-            logger.info(f"Task cleanup completed: {removed_tasks} tasks removed")
+            if not logs_future.result():
+                success = False
         except Exception as e:
-            logger.error(f"Task cleanup failed: {str(e)}")
-            success = False
-
-        # Cleanup log files
-        if not cleanup_log_files():
-            success = False
-
-        # Cleanup backup files
-        if not cleanup_backup_files():
+            logger.error(f"Log cleanup failed: {str(e)}")
             success = False
 
         if success:
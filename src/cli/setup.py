@@ -12,6 +12,10 @@ DESCRIPTION = 'A production-ready command-line to-do list application for effici
 AUTHOR = 'Project Author'
 AUTHOR_EMAIL = 'author@example.com'
 
+# Accepted requirement line: package name with an optional single version specifier.
+# Matched against raw bytes; requirement lines are ASCII, so no decoding is needed
+_REQ_RE = re.compile(rb'^[A-Za-z0-9][A-Za-z0-9._-]*[A-Za-z0-9]([><=!~]=?[0-9.*]+)?$')
+
 def read_requirements():
     """
     Securely reads and validates package requirements from requirements.txt
@@ -20,16 +24,18 @@ def read_requirements():
     requirements = []
     try:
         req_path = os.path.join(os.path.dirname(__file__), 'requirements.txt')
-        with open(req_path, 'r', encoding='utf-8') as f:
+        with open(req_path, 'rb') as f:
             for line in f:
                 line = line.strip()
                 # Skip comments and empty lines
-                if line and not line.startswith('#'):
-                    # Validate requirement format
-                    if re.match(r'^[A-Za-z0-9][A-Za-z0-9._-]*[A-Za-z0-9]([><=!~]=?[0-9.*]+)?$', line):
-                        requirements.append(line)
+                if line and not line.startswith(b'#'):
+                    # Validate requirement format; names must start alphanumeric,
+                    # which rejects most malformed lines before the regex runs
+                    if line[:1].isalnum() and _REQ_RE.match(line):
+                        requirements.append(line.decode('ascii'))
                     else:
-                        raise ValueError(f'Invalid requirement format: {line}')
+                        raise ValueError(
+                            f"Invalid requirement format: {line.decode('utf-8', 'replace')}")
     except FileNotFoundError:
         print('Warning: requirements.txt not found. Using default requirements.')
         requirements = ['setuptools>=42.0.0', 'wheel>=0.37.0']
@@ -90,6 +96,12 @@ setup(
     python_requires='>=3.6',
     packages=find_packages(exclude=['tests*', 'docs*']),
     install_requires=read_requirements(),
+    extras_require={
+        # Optional C-accelerated JSON for the task file; stdlib json otherwise
+        'speedups': ['orjson>=3.0'],
+        # Parallel test runs; see infrastructure/config/pytest.ini
+        'test': ['pytest-xdist>=2.5.0'],
+    },
     zip_safe=False,
     include_package_data=True,
     entry_points={
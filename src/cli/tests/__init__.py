@@ -14,7 +14,8 @@ from .conftest import (
     temp_storage_path,
     task_storage,
     task_manager,
-    sample_tasks
+    sample_tasks,
+    sample_tasks_copy
 )
 
 # Export fixtures for test suite usage
@@ -22,7 +23,8 @@ __all__ = [
     "temp_storage_path",  # Provides temporary file system path for isolated test storage
     "task_storage",       # Provides TaskStorage instance for data persistence
     "task_manager",       # Provides TaskManager instance for task operations
-    "sample_tasks"        # Provides predefined task data for test scenarios
+    "sample_tasks",       # Provides predefined task data for test scenarios
+    "sample_tasks_copy"   # Provides modifiable copies of the sample tasks
 ]
 
 # Ensure fixtures are properly registered with pytest
@@ -8,11 +8,13 @@ Version: 1.0
 Python: 3.6+
 """
 
+import copy
 import os
+import re
 import tempfile
 import pytest
 from datetime import datetime
-from typing import List, Dict, Any, Generator
+from typing import List, Dict, Any, Generator, Tuple
 
 from ..models.task import Task
 from ..data.storage import TaskStorage
@@ -22,31 +24,92 @@ from ..core.task_manager import TaskManager
 TEST_FILE_PERMISSIONS = 0o600
 MAX_TEST_TASKS = 10
 PERFORMANCE_THRESHOLD_MS = 1000  # 1 second max per operation
+SAMPLE_TIMESTAMP = datetime(2024, 1, 1)  # naive UTC, like Task timestamps
+# Leftover test files: test_*.json or *.bak
+_TEST_FILE_RE = re.compile(r'test_.*\.json|.*\.bak', re.DOTALL)
 
-@pytest.fixture(scope="function")
-def temp_storage_path() -> Generator[str, None, None]:
+# Opt-in markers and the command line flag that enables each of them
+_OPT_IN_MARKERS = {
+    "memprofile": "--memprofile",
+    "slow": "--runslow",
+}
+
+def pytest_addoption(parser) -> None:
     """
-    Provides a secure temporary file path for test storage with guaranteed cleanup.
+    Adds the opt-in --memprofile and --runslow flags.
     
-    Yields:
-        str: Path to temporary storage file with proper permissions
+    Args:
+        parser: pytest command line parser
     """
-    try:
-        # Create temporary directory with secure permissions
-        temp_dir = tempfile.mkdtemp()
-        os.chmod(temp_dir, TEST_FILE_PERMISSIONS)
-        
-        # Create temporary file path
-        temp_file = os.path.join(temp_dir, "test_tasks.json")
-        
-        yield temp_file
+    parser.addoption(
+        "--memprofile",
+        action="store_true",
+        default=False,
+        help="run memprofile tests under memory_profiler (slow)"
+    )
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run slow tests, such as the full storage stress loop"
+    )
+
+def pytest_configure(config) -> None:
+    """
+    Registers the opt-in markers.
+    
+    Args:
+        config: pytest configuration object
+    """
+    config.addinivalue_line(
+        "markers",
+        "memprofile: per-line memory profiling, only run with --memprofile"
+    )
+    config.addinivalue_line(
+        "markers",
+        "slow: long-running I/O test, only run with --runslow"
+    )
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """
+    Skips opt-in tests unless their command line flag was given.
+    
+    memory_profiler samples RSS on every traced line, which distorts any
+    timing taken alongside it, and slow tests are dominated by disk I/O, so
+    both stay out of regular runs.
+    
+    Args:
+        config: pytest configuration object
+        items: collected test items
+    """
+    skips = {
+        marker: pytest.mark.skip(reason=f"needs {flag} option to run")
+        for marker, flag in _OPT_IN_MARKERS.items()
+        if not config.getoption(flag)
+    }
+    if not skips:
+        return
+    for item in items:
+        for marker, skip in skips.items():
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+@pytest.fixture(scope="function")
+def temp_storage_path(tmp_path) -> str:
+    """
+    Provides a temporary file path for test storage.
+    
+    Built on pytest's tmp_path, an owner-only per-test directory that pytest
+    removes itself, together with any journal or backup files written beside
+    the task file.
+    
+    Args:
+        tmp_path: pytest per-test temporary directory
         
-    finally:
-        # Ensure cleanup of test files
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
-        if os.path.exists(temp_dir):
-            os.rmdir(temp_dir)
+    Returns:
+        str: Path to temporary storage file
+    """
+    return str(tmp_path / "test_tasks.json")
 
 @pytest.fixture(scope="function")
 def task_storage(temp_storage_path: str) -> TaskStorage:
@@ -70,10 +133,6 @@ def task_storage(temp_storage_path: str) -> TaskStorage:
     end_time = datetime.utcnow()
     duration_ms = (end_time - start_time).total_seconds() * 1000
     assert duration_ms <= PERFORMANCE_THRESHOLD_MS, f"Storage operation exceeded {PERFORMANCE_THRESHOLD_MS}ms threshold"
-    
-    # Cleanup
-    if os.path.exists(temp_storage_path):
-        os.unlink(temp_storage_path)
 
 @pytest.fixture(scope="function")
 def task_manager(task_storage: TaskStorage) -> TaskManager:
@@ -98,37 +157,40 @@ def task_manager(task_storage: TaskStorage) -> TaskManager:
         assert duration <= PERFORMANCE_THRESHOLD_MS, \
             f"Operation {operation} exceeded {PERFORMANCE_THRESHOLD_MS}ms threshold"
 
-@pytest.fixture(scope="function")
-def sample_tasks() -> List[Task]:
+@pytest.fixture(scope="session")
+def sample_tasks() -> Tuple[Task, ...]:
     """
     Provides a comprehensive set of test tasks with boundary conditions.
     
+    Built and validated once per session with fixed timestamps; tests that
+    modify tasks should use sample_tasks_copy instead.
+    
     Returns:
-        List[Task]: List of validated Task instances
+        Tuple[Task, ...]: Validated Task instances shared across the session
     """
-    tasks = [
+    tasks = (
         Task(
             id=1,
             description="Normal task",
             status="pending",
-            created=datetime.utcnow(),
-            modified=datetime.utcnow()
+            created=SAMPLE_TIMESTAMP,
+            modified=SAMPLE_TIMESTAMP
         ),
         Task(
             id=2,
             description="A" * 200,  # Maximum length
             status="pending",
-            created=datetime.utcnow(),
-            modified=datetime.utcnow()
+            created=SAMPLE_TIMESTAMP,
+            modified=SAMPLE_TIMESTAMP
         ),
         Task(
             id=3,
             description="Task with punctuation: Hello, World!",
             status="completed",
-            created=datetime.utcnow(),
-            modified=datetime.utcnow()
+            created=SAMPLE_TIMESTAMP,
+            modified=SAMPLE_TIMESTAMP
         )
-    ]
+    )
     
     # Validate all test tasks
     for task in tasks:
@@ -136,6 +198,19 @@ def sample_tasks() -> List[Task]:
     
     return tasks
 
+@pytest.fixture(scope="function")
+def sample_tasks_copy(sample_tasks: Tuple[Task, ...]) -> List[Task]:
+    """
+    Provides per-test shallow copies of the session sample tasks.
+    
+    Args:
+        sample_tasks: Session-scoped sample tasks
+        
+    Returns:
+        List[Task]: Task copies that are safe to modify
+    """
+    return [copy.copy(task) for task in sample_tasks]
+
 @pytest.fixture(scope="session")
 def performance_metrics() -> Dict[str, float]:
     """
@@ -157,28 +232,31 @@ def cleanup_test_files() -> None:
     """
     yield
     
-    # Clean up any remaining test files
-    test_patterns = ['test_*.json', '*.bak']
-    for pattern in test_patterns:
-        for file in tempfile.gettempdir().glob(pattern):
+    # Clean up any remaining test files in one pass over the temp directory
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
+            if not _TEST_FILE_RE.fullmatch(entry.name):
+                continue
             try:
-                os.unlink(file)
+                os.unlink(entry.path)
             except (OSError, PermissionError):
                 continue
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def verify_file_permissions() -> None:
     """
-    Automatically verifies secure file permissions after each test.
+    Verifies secure file permissions of leftover test files once the session ends.
     """
     yield
     
-    # Check permissions of any remaining test files
-    test_dir = tempfile.gettempdir()
-    for file in os.listdir(test_dir):
-        if file.startswith('test_'):
-            file_path = os.path.join(test_dir, file)
-            if os.path.exists(file_path):
-                mode = os.stat(file_path).st_mode & 0o777
+    # Check permissions of any remaining test files; DirEntry.stat() needs a
+    # single syscall per entry
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
+            if entry.name.startswith('test_'):
+                try:
+                    mode = entry.stat().st_mode & 0o777
+                except FileNotFoundError:
+                    continue
                 assert mode <= TEST_FILE_PERMISSIONS, \
-                    f"Insecure file permissions detected: {oct(mode)}"
\ No newline at end of file
+                    f"Insecure file permissions detected: {oct(mode)}"
@@ -12,7 +12,6 @@ from unittest.mock import Mock, patch  # version: 3.6+
 import time  # version: 3.6+
 from typing import Tuple, List, Dict, Any  # version: 3.6+
 import os
-import tempfile
 
 from ..interfaces.cli_interface import CLIInterface
 from ..interfaces.menu_interface import MenuInterface
@@ -22,16 +21,17 @@ from ..exceptions.task_exceptions import TaskValidationError, TaskNotFoundError
 from ..constants.messages import SUCCESS_MESSAGES, ERROR_MESSAGES
 
 @pytest.fixture
-def setup_test_environment() -> Tuple[CLIInterface, Mock, str]:
+def setup_test_environment(tmp_path) -> Tuple[CLIInterface, Mock, str]:
     """
     Sets up test environment with temporary storage and mocked interfaces.
     
+    Args:
+        tmp_path: pytest per-test temporary directory, removed by pytest
+    
     Returns:
         Tuple containing CLI interface instance, mocked menu interface, and temp path
     """
-    # Create temporary directory for test storage
-    temp_dir = tempfile.mkdtemp()
-    storage_path = os.path.join(temp_dir, 'test_tasks.json')
+    storage_path = str(tmp_path / 'test_tasks.json')
     
     # Create mock menu interface
     mock_menu = Mock(spec=MenuInterface)
@@ -40,12 +40,7 @@ def setup_test_environment() -> Tuple[CLIInterface, Mock, str]:
     cli = CLIInterface(storage_path)
     cli._menu_interface = mock_menu
     
-    yield cli, mock_menu, storage_path
-    
-    # Cleanup
-    if os.path.exists(storage_path):
-        os.remove(storage_path)
-    os.rmdir(temp_dir)
+    return cli, mock_menu, storage_path
 
 @pytest.mark.unit
 def test_cli_initialization(setup_test_environment):
@@ -175,6 +170,29 @@ def test_complete_task_flow(setup_test_environment):
     # Verify success message
     mock_menu.show_message.assert_called_with(SUCCESS_MESSAGES['task_completed'], 'success')
 
+@pytest.mark.integration
+def test_view_tasks_after_complete(setup_test_environment):
+    """
+    Tests that the cached task list reflects a completion.
+    Verifies the list shown after completing a task has its new status.
+    """
+    cli, mock_menu, _ = setup_test_environment
+    task = cli._task_manager.create_task("Test task")
+
+    # Populate the task list cache
+    cli.handle_view_tasks()
+
+    # Complete the task, then view the list again
+    mock_menu.display_completion_menu.return_value = task.id
+    cli.handle_complete_task()
+    cli.handle_view_tasks()
+
+    # Verify the displayed task is the completed one
+    displayed_tasks = mock_menu.display_task_list.call_args[0][0]
+    assert len(displayed_tasks) == 1
+    assert displayed_tasks[0].status == "completed"
+    assert displayed_tasks[0] is cli._task_manager.get_task(task.id)
+
 @pytest.mark.security
 def test_input_validation(setup_test_environment):
     """
@@ -218,10 +236,10 @@ def test_error_handling(setup_test_environment):
         cli.handle_add_task()
     os.chmod(storage_path, 0o600)  # Restore permissions
     
-    # Test task limit error
-    for i in range(1001):  # Exceed 1000 task limit
-        task = Task(id=i, description=f"Task {i}", status="pending")
-        cli._task_manager._task_cache[task.id] = task
+    # Test task limit error; only the cache size matters, so one task
+    # object fills every slot
+    filler_task = Task(id=0, description="Task", status="pending")
+    cli._task_manager._task_cache.update(dict.fromkeys(range(1001), filler_task))  # Exceed 1000 task limit
     
     mock_menu.display_task_input.return_value = "New task"
     with pytest.raises(TaskError):
@@ -9,69 +9,109 @@ import pytest  # version: 6.0.0+
 from unittest.mock import Mock, patch  # version: 3.6+
 import time  # version: 3.6+
 from datetime import datetime
+import builtins
 import io
+import itertools
+import re
 import sys
+from contextlib import contextmanager
+from typing import Iterable, Iterator
 
+from ..interfaces import menu_interface as menu_module
 from ..interfaces.menu_interface import MenuInterface
 from ..models.task import Task
 from ..constants.messages import MENU_MESSAGES, ERROR_MESSAGES, INFO_MESSAGES
 from ..constants.symbols import BORDER_SYMBOLS, STATUS_SYMBOLS
 
+# Strings the main menu must render, matched in a single pass over the output
+MAIN_MENU_TOKENS = (
+    MENU_MESSAGES['main_title'],
+    BORDER_SYMBOLS['TOP_LEFT'],
+    BORDER_SYMBOLS['TOP_RIGHT'],
+    MENU_MESSAGES['add_task'],
+    MENU_MESSAGES['view_tasks'],
+    MENU_MESSAGES['complete_task'],
+    MENU_MESSAGES['exit'],
+    MENU_MESSAGES['choice_prompt'],
+)
+_MAIN_MENU_TOKEN_RE = re.compile('|'.join(map(re.escape, MAIN_MENU_TOKENS)))
+SCREEN_WIDTH = 80
+
+def _max_line_width(output: str) -> int:
+    """Returns the longest line length in characters, scanning in C via map/max."""
+    return max(map(len, output.split('\n')))
+
+@contextmanager
+def _stub_input(responses: Iterable[str]) -> Iterator[None]:
+    """
+    Replaces builtins.input with a plain function returning successive responses.
+    
+    Cheaper than patch(), which routes every call through MagicMock and
+    records it; none of these tests inspect input() calls.
+    
+    Args:
+        responses: Values returned by successive input() calls
+    """
+    remaining = iter(responses)
+    original = builtins.input
+    builtins.input = lambda _prompt='': next(remaining)
+    try:
+        yield
+    finally:
+        builtins.input = original
+
+class _Sink:
+    """Write-only stdout replacement for tests that never read the output."""
+    write = staticmethod(lambda text: len(text))
+    flush = staticmethod(lambda: None)
+    isatty = staticmethod(lambda: False)
+
 class TestMenuInterface:
     """Test suite for MenuInterface class functionality."""
 
     @pytest.fixture
     def menu_interface(self):
         """Fixture providing a fresh MenuInterface instance for each test."""
-        with patch('sys.stdout', new_callable=io.StringIO), \
-             patch('builtins.input', return_value='4'):
+        with patch('sys.stdout', new=_Sink()), _stub_input(itertools.repeat('4')):
             interface = MenuInterface()
             return interface
 
     @pytest.fixture
     def sample_tasks(self):
         """Fixture providing a list of test tasks with various states."""
+        now = datetime.utcnow()
         return [
-            Task(1, "First task", "pending", datetime.utcnow(), datetime.utcnow()),
-            Task(2, "Second task", "completed", datetime.utcnow(), datetime.utcnow()),
+            Task(1, "First task", "pending", now, now),
+            Task(2, "Second task", "completed", now, now),
             Task(3, "Third task with a very long description that should be truncated", "pending", 
-                 datetime.utcnow(), datetime.utcnow())
+                 now, now)
         ]
 
     @pytest.mark.menu
     def test_display_menu_shows_correct_options(self, menu_interface):
         """Test that main menu displays all required options with correct formatting."""
         with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout, \
-             patch('builtins.input', return_value='4'):
+             _stub_input(itertools.repeat('4')):
             
             menu_interface.display_menu()
             output = mock_stdout.getvalue()
 
-            # Verify menu title and borders
-            assert MENU_MESSAGES['main_title'] in output
-            assert BORDER_SYMBOLS['TOP_LEFT'] in output
-            assert BORDER_SYMBOLS['TOP_RIGHT'] in output
-            
-            # Verify all menu options are present
-            assert MENU_MESSAGES['add_task'] in output
-            assert MENU_MESSAGES['view_tasks'] in output
-            assert MENU_MESSAGES['complete_task'] in output
-            assert MENU_MESSAGES['exit'] in output
+            # Verify title, borders, all menu options and the choice prompt
+            missing = set(MAIN_MENU_TOKENS).difference(_MAIN_MENU_TOKEN_RE.findall(output))
+            assert not missing, f"Menu is missing: {sorted(missing)}"
 
             # Verify menu formatting
-            lines = output.split('\n')
-            assert all(len(line) <= 80 for line in lines), "Menu exceeds 80 character width limit"
-            assert any(MENU_MESSAGES['choice_prompt'] in line for line in lines)
+            assert _max_line_width(output) <= SCREEN_WIDTH, "Menu exceeds 80 character width limit"
 
     @pytest.mark.menu
     @pytest.mark.input
     def test_display_menu_validates_input(self, menu_interface):
         """Test menu input validation including invalid inputs and edge cases."""
-        invalid_inputs = ['a', '0', '5', ' ', '#']
+        invalid_inputs = ('a', '0', '5', ' ', '#')
         valid_input = '2'
         
         with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout, \
-             patch('builtins.input', side_effect=invalid_inputs + [valid_input]):
+             _stub_input(invalid_inputs + (valid_input,)):
             
             result = menu_interface.display_menu()
             output = mock_stdout.getvalue()
@@ -87,7 +127,7 @@ class TestMenuInterface:
     def test_display_task_list_formatting(self, menu_interface, sample_tasks):
         """Test task list display formatting and pagination."""
         with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout, \
-             patch('builtins.input', return_value='\n'):
+             _stub_input(itertools.repeat('\n')):
             
             menu_interface.display_task_list(sample_tasks)
             output = mock_stdout.getvalue()
@@ -114,7 +154,7 @@ class TestMenuInterface:
         valid_desc = "Valid task description"
         
         with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout, \
-             patch('builtins.input', side_effect=[invalid_desc, valid_desc]):
+             _stub_input((invalid_desc, valid_desc)):
             
             result = menu_interface.display_task_input()
             output = mock_stdout.getvalue()
@@ -124,22 +164,37 @@ class TestMenuInterface:
             assert result == valid_desc
 
             # Verify screen formatting
-            assert len(max(output.split('\n'), key=len)) <= 80
+            assert _max_line_width(output) <= SCREEN_WIDTH
+
+    @pytest.mark.performance
+    def test_task_list_render_reused_until_tasks_change(self, menu_interface, sample_tasks):
+        """Test that unchanged task lists are rendered once and re-rendered after a change."""
+        with patch('sys.stdout', new=_Sink()), \
+             _stub_input(itertools.repeat('')), \
+             patch.object(menu_module, 'print_task_list', wraps=print) as mock_render:
+
+            menu_interface.display_task_list(sample_tasks)
+            menu_interface.display_task_list(sample_tasks)
+            assert mock_render.call_count == 1
+
+            sample_tasks[0].mark_complete()
+            menu_interface.display_task_list(sample_tasks)
+            assert mock_render.call_count == 2
 
     @pytest.mark.performance
     def test_menu_performance_requirements(self, menu_interface, sample_tasks):
         """Test menu component performance against requirements."""
-        with patch('time.time', side_effect=[0.0, 0.05, 0.1, 0.15]):  # Simulate time intervals
+        with patch('sys.stdout', new=_Sink()), _stub_input(itertools.repeat('4')):
             
             # Test menu display time (<100ms)
-            start = time.time()
+            start = time.perf_counter()
             menu_interface.display_menu()
-            assert time.time() - start < 0.1, "Menu display exceeded 100ms limit"
+            assert time.perf_counter() - start < 0.1, "Menu display exceeded 100ms limit"
 
             # Test task list display time (<200ms)
-            start = time.time()
+            start = time.perf_counter()
             menu_interface.display_task_list(sample_tasks)
-            assert time.time() - start < 0.2, "Task list display exceeded 200ms limit"
+            assert time.perf_counter() - start < 0.2, "Task list display exceeded 200ms limit"
 
     @pytest.mark.error
     def test_error_message_display(self, menu_interface):
@@ -153,7 +208,7 @@ class TestMenuInterface:
             # Verify error formatting
             assert STATUS_SYMBOLS['ERROR'] in output
             assert test_error in output
-            assert len(max(output.split('\n'), key=len)) <= 80
+            assert _max_line_width(output) <= SCREEN_WIDTH
 
     @pytest.mark.keyboard
     def test_keyboard_interrupt_handling(self, menu_interface):
@@ -9,11 +9,9 @@ Python: 3.6+
 """
 
 import os
-import json
 import stat
-import tempfile
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import pytest  # version: 6.0.0+
 
 from ..data.storage import TaskStorage
@@ -29,21 +27,28 @@ PERFORMANCE_THRESHOLDS = {
     'task_retrieval': 200,  # ms
     'file_save': 300,      # ms
 }
+# Save/load cycles in the stress test; the full count only runs with --runslow
+STRESS_ITERATIONS = 10
+SLOW_STRESS_ITERATIONS = 100
+# Fixed benchmark rounds: each storage call writes the JSON file, so letting
+# pytest-benchmark calibrate would run thousands of disk writes per test
+BENCHMARK_ROUNDS = {'rounds': 20, 'iterations': 1, 'warmup_rounds': 1}
 
 @pytest.fixture
-def temp_storage_path() -> str:
+def temp_storage_path(tmp_path) -> str:
     """
-    Creates a temporary storage file with proper permissions.
+    Provides a storage file path in a per-test temporary directory.
     
+    The file is not pre-created: TaskStorage writes it with FILE_PERMISSIONS
+    itself, and pytest removes the directory along with any journal files.
+    
+    Args:
+        tmp_path: pytest per-test temporary directory
+        
     Returns:
         str: Path to temporary storage file
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tf:
-        temp_path = tf.name
-    os.chmod(temp_path, FILE_SETTINGS['FILE_PERMISSIONS'])
-    yield temp_path
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    return str(tmp_path / "tasks.json")
 
 @pytest.fixture
 def task_storage(temp_storage_path: str) -> TaskStorage:
@@ -56,29 +61,43 @@ def task_storage(temp_storage_path: str) -> TaskStorage:
     Returns:
         TaskStorage: Initialized storage instance
     """
-    storage = TaskStorage(temp_storage_path)
-    yield storage
-    if os.path.exists(temp_storage_path):
-        os.unlink(temp_storage_path)
+    return TaskStorage(temp_storage_path)
 
-@pytest.fixture
-def sample_tasks() -> List[Task]:
+@pytest.fixture(scope="module")
+def sample_tasks() -> Tuple[Task, ...]:
     """
-    Generates a list of sample tasks for testing.
+    Generates sample tasks once per module, sharing a single timestamp.
+    
+    The tasks are shared by every test in the module; tests must not modify
+    them.
     
     Returns:
-        List[Task]: List of sample Task objects
+        Tuple[Task, ...]: Sample Task objects
     """
-    return [
+    now = datetime.utcnow()
+    return tuple(
         Task(
             id=i,
             description=f"Test task {i}",
             status='pending',
-            created=datetime.utcnow(),
-            modified=datetime.utcnow()
+            created=now,
+            modified=now
         )
         for i in range(TEST_TASK_COUNT)
-    ]
+    )
+
+def test_storage_interface():
+    """Tests that TaskStorage exposes the required persistence methods."""
+    required_methods = {
+        'load_tasks',
+        'save_tasks',
+        'add_task',
+        'update_task',
+        'get_task',
+        'create_backup'
+    }
+    missing = {name for name in required_methods if not callable(getattr(TaskStorage, name, None))}
+    assert not missing, f"TaskStorage missing required methods: {missing}"
 
 def test_storage_initialization(temp_storage_path: str):
     """Tests TaskStorage initialization with various scenarios."""
@@ -96,6 +115,19 @@ def test_storage_initialization(temp_storage_path: str):
     with pytest.raises(FileAccessError):
         TaskStorage(temp_storage_path)
 
+@pytest.mark.persistence
+def test_journal_without_task_file(temp_storage_path: str):
+    """Tests that journaled tasks survive a missing task file."""
+    storage = TaskStorage(temp_storage_path)
+    storage.add_task(Task(1, "Journaled task", created=datetime.utcnow()))
+    storage._close_journal()
+    os.remove(temp_storage_path)
+
+    # Reopening replays the journal into the recreated task file
+    reopened = TaskStorage(temp_storage_path)
+    assert [task.id for task in reopened.get_all_tasks()] == [1]
+    assert [task.id for task in TaskStorage(temp_storage_path).get_all_tasks()] == [1]
+
 @pytest.mark.security
 def test_file_security(task_storage: TaskStorage):
     """Tests storage security measures and file permissions."""
@@ -117,15 +149,25 @@ def test_file_security(task_storage: TaskStorage):
     assert stat.S_IMODE(os.stat(file_path).st_mode) == FILE_SETTINGS['FILE_PERMISSIONS']
 
 @pytest.mark.persistence
-def test_task_persistence(task_storage: TaskStorage, sample_tasks: List[Task]):
+def test_backup_includes_journal(task_storage: TaskStorage):
+    """Tests that a backup includes changes held only in the journal."""
+    task_storage.add_task(Task(1, "Journaled task", created=datetime.utcnow()))
+
+    backup_path = task_storage.create_backup()
+    backup = TaskStorage(backup_path)
+    assert [task.id for task in backup.get_all_tasks()] == [1]
+
+@pytest.mark.persistence
+def test_task_persistence(task_storage: TaskStorage, sample_tasks: Tuple[Task, ...]):
     """Tests task data persistence and integrity."""
     # Test task addition and persistence
     for task in sample_tasks[:10]:
         assert task_storage.add_task(task)
     
-    # Verify data integrity after reload
-    reloaded_storage = TaskStorage(task_storage._file_path)
-    stored_tasks = reloaded_storage.get_all_tasks()
+    # Verify data integrity after an in-place reload, which rebuilds the
+    # task list from the file and journal
+    task_storage.load_tasks()
+    stored_tasks = task_storage.get_all_tasks()
     assert len(stored_tasks) == 10
     
     # Verify task data accuracy
@@ -168,10 +210,50 @@ def test_task_operations(task_storage: TaskStorage):
     updated_task = task_storage.get_task(1)
     assert updated_task.status == 'completed'
     
-    # Test task limit enforcement
+    # Test task limit enforcement at the boundary, prefilled with one save
+    now = datetime.utcnow()
+    with task_storage.batch():
+        for i in range(2, MAX_TASKS):
+            task_storage.add_task(Task(i, f"Task {i}", created=now))
+    assert task_storage.add_task(Task(MAX_TASKS, "Last task", created=now))
     with pytest.raises(ValueError):
-        for i in range(MAX_TASKS + 1):
-            task_storage.add_task(Task(i + 2, f"Task {i}", created=datetime.utcnow()))
+        task_storage.add_task(Task(MAX_TASKS + 1, "Overflow task", created=now))
+
+@pytest.mark.operations
+def test_prune_tasks(task_storage: TaskStorage):
+    """Tests in-place removal of tasks matching a predicate."""
+    for i in range(1, 4):
+        task_storage.add_task(Task(i, f"Task {i}", created=datetime.utcnow()))
+    
+    assert task_storage.prune_tasks(lambda task: task.id == 2) == 1
+    assert [task.id for task in task_storage.get_all_tasks()] == [1, 3]
+    assert task_storage.get_task(2) is None
+    assert task_storage.get_task(3).id == 3
+    
+    # Nothing matching leaves storage untouched
+    assert task_storage.prune_tasks(lambda task: False) == 0
+
+@pytest.mark.operations
+def test_transaction_rollback(task_storage: TaskStorage):
+    """Tests that a failed transaction undoes its add or update."""
+    task_storage.add_task(Task(1, "Kept task", created=datetime.utcnow()))
+
+    # A failed add is removed again
+    with pytest.raises(RuntimeError):
+        with task_storage.transaction(2):
+            task_storage.add_task(Task(2, "Rolled back task", created=datetime.utcnow()))
+            raise RuntimeError("Simulated failure")
+
+    # A failed in-place update is undone
+    with pytest.raises(RuntimeError):
+        with task_storage.transaction(1):
+            task_storage.get_task(1).status = 'completed'
+            raise RuntimeError("Simulated failure")
+
+    assert [(task.id, task.status) for task in task_storage.get_all_tasks()] == [(1, 'pending')]
+    assert task_storage.get_task(2) is None
+    task_storage.load_tasks()
+    assert [(task.id, task.status) for task in task_storage.get_all_tasks()] == [(1, 'pending')]
 
 @pytest.mark.error_handling
 def test_error_handling(task_storage: TaskStorage):
@@ -194,13 +276,13 @@ def test_error_handling(task_storage: TaskStorage):
         task_storage.update_task(Task(999, "Nonexistent task"))
 
 @pytest.mark.benchmark
-def test_performance(task_storage: TaskStorage, sample_tasks: List[Task], benchmark):
+def test_performance(task_storage: TaskStorage, sample_tasks: Tuple[Task, ...], benchmark):
     """Tests storage operation performance against benchmarks."""
     # Test task addition performance
     def add_task():
         task_storage.add_task(sample_tasks[0])
     
-    result = benchmark(add_task)
+    result = benchmark.pedantic(add_task, **BENCHMARK_ROUNDS)
     assert result.stats['mean'] * 1000 < PERFORMANCE_THRESHOLDS['task_addition']
     
     # Test task retrieval performance
@@ -209,18 +291,22 @@ def test_performance(task_storage: TaskStorage, sample_tasks: List[Task], benchm
     def get_task():
         task_storage.get_task(sample_tasks[0].id)
     
-    result = benchmark(get_task)
+    result = benchmark.pedantic(get_task, **BENCHMARK_ROUNDS)
     assert result.stats['mean'] * 1000 < PERFORMANCE_THRESHOLDS['task_retrieval']
     
     # Test file save performance
     def save_tasks():
         task_storage.save_tasks()
     
-    result = benchmark(save_tasks)
+    result = benchmark.pedantic(save_tasks, **BENCHMARK_ROUNDS)
     assert result.stats['mean'] * 1000 < PERFORMANCE_THRESHOLDS['file_save']
 
 @pytest.mark.stress
-def test_stress_conditions(task_storage: TaskStorage, sample_tasks: List[Task]):
+@pytest.mark.parametrize("iterations", [
+    STRESS_ITERATIONS,
+    pytest.param(SLOW_STRESS_ITERATIONS, marks=pytest.mark.slow),
+])
+def test_stress_conditions(task_storage: TaskStorage, sample_tasks: Tuple[Task, ...], iterations: int):
     """Tests storage behavior under stress conditions."""
     # Test large dataset handling
     for task in sample_tasks:
@@ -228,7 +314,7 @@ def test_stress_conditions(task_storage: TaskStorage, sample_tasks: List[Task]):
     assert len(task_storage.get_all_tasks()) == TEST_TASK_COUNT
     
     # Test rapid consecutive operations
-    for _ in range(100):
+    for _ in range(iterations):
         task_storage.save_tasks()
         task_storage.load_tasks()
     
@@ -10,14 +10,31 @@ import os
 import pytest  # version: 6.0.0+
 import time
 from datetime import datetime
-from typing import List, Dict, Any
-from memory_profiler import profile  # version: 0.60.0+
+from typing import List, Dict, Any, Tuple
+from unittest.mock import patch
 
 from ..core.task_manager import TaskManager
 from ..models.task import Task
 from ..exceptions.task_exceptions import TaskValidationError, TaskNotFoundError, TaskLimitError
 from ..exceptions.storage_exceptions import FileAccessError, DataCorruptionError
 
+# Test data constants, built once at import
+LONG_DESCRIPTION = "a" * 201
+INVALID_DESCRIPTIONS = (
+    "",  # Empty string
+    LONG_DESCRIPTION,  # Too long
+    None,  # None value
+    "<script>alert('xss')</script>",  # Injection attempt
+    "   ",  # Whitespace only
+)
+DANGEROUS_INPUTS = (
+    "'; DROP TABLE tasks; --",
+    "<script>alert('xss')</script>",
+    "../../../etc/passwd",
+    "\x00\x1f\x7f",
+    "{{7*7}}"
+)
+
 # Test fixtures and configuration
 @pytest.fixture
 def temp_storage_path(tmp_path) -> str:
@@ -33,14 +50,14 @@ def task_manager(temp_storage_path) -> TaskManager:
     if os.path.exists(temp_storage_path):
         os.remove(temp_storage_path)
 
-@pytest.fixture
-def sample_tasks() -> List[Dict[str, Any]]:
-    """Provides sample task data for testing."""
-    return [
+@pytest.fixture(scope="module")
+def sample_tasks() -> Tuple[Dict[str, Any], ...]:
+    """Provides sample task data for testing; shared per module, do not modify."""
+    return (
         {"description": "Test task 1", "status": "pending"},
         {"description": "Test task 2", "status": "completed"},
         {"description": "Test task 3", "status": "pending"}
-    ]
+    )
 
 # Core functionality tests
 class TestTaskCreation:
@@ -58,13 +75,8 @@ class TestTaskCreation:
         assert isinstance(task.created, datetime)
         assert isinstance(task.modified, datetime)
 
-    @pytest.mark.parametrize("invalid_description", [
-        "",  # Empty string
-        "a" * 201,  # Too long
-        None,  # None value
-        "<script>alert('xss')</script>",  # Injection attempt
-        "   ",  # Whitespace only
-    ])
+    @pytest.mark.parametrize("invalid_description", INVALID_DESCRIPTIONS,
+                             ids=("empty", "too_long", "none", "injection", "whitespace"))
     def test_create_task_validation(self, task_manager: TaskManager, invalid_description):
         """Tests task creation with invalid inputs."""
         with pytest.raises(TaskValidationError):
@@ -72,9 +84,14 @@ class TestTaskCreation:
 
     def test_create_task_limit(self, task_manager: TaskManager):
         """Validates task limit enforcement."""
-        # Create maximum allowed tasks
-        for i in range(1000):
-            task_manager.create_task(f"Task {i}")
+        # Fill to one below the limit, batched into a single save
+        with task_manager._storage.batch():
+            for i in range(999):
+                task_manager.create_task(f"Task {i}")
+        assert len(task_manager.get_all_tasks()) == 999
+
+        # The last slot is still available on the regular single-task path
+        task_manager.create_task("Last task")
 
         # Attempt to exceed limit
         with pytest.raises(TaskLimitError):
@@ -130,6 +147,32 @@ class TestTaskCompletion:
         assert updated_task.status == "completed"
         assert updated_task.modified > task.modified
 
+    def test_pending_tasks_track_completion(self, task_manager: TaskManager):
+        """Validates that pending tasks are tracked through creation and completion."""
+        first = task_manager.create_task("Test task 1")
+        second = task_manager.create_task("Test task 2")
+        assert task_manager.get_pending_tasks() == [first, second]
+
+        task_manager.complete_task(first.id)
+        assert task_manager.get_pending_tasks() == [second]
+
+    def test_complete_task_rolls_back_on_failure(self, task_manager: TaskManager):
+        """Validates a failed save leaves the task pending in memory and on disk."""
+        task = task_manager.create_task("Rollback test task")
+
+        with patch.object(task_manager._storage, 'update_task',
+                          side_effect=FileAccessError("Simulated write failure")):
+            with pytest.raises(FileAccessError):
+                task_manager.complete_task(task.id)
+
+        assert task_manager.get_task(task.id).status == 'pending'
+        assert [t.id for t in task_manager.get_pending_tasks()] == [task.id]
+        assert task_manager._storage.get_task(task.id).status == 'pending'
+
+        # The rolled-back state is what was persisted
+        task_manager._storage.load_tasks()
+        assert task_manager._storage.get_task(task.id).status == 'pending'
+
     def test_complete_nonexistent_task(self, task_manager: TaskManager):
         """Validates handling of completing non-existent task."""
         with pytest.raises(TaskNotFoundError):
@@ -140,7 +183,6 @@ class TestTaskCompletion:
 class TestPerformance:
     """Test suite for performance requirements."""
 
-    @profile
     def test_task_operations_performance(self, task_manager: TaskManager):
         """Validates performance metrics for core operations."""
         # Measure task creation time
@@ -161,6 +203,19 @@ class TestPerformance:
         completion_time = (time.time() - start_time) * 1000
         assert completion_time < 500, "Task completion exceeded 500ms limit"
 
+    @pytest.mark.memprofile
+    def test_task_operations_memory_profile(self, task_manager: TaskManager):
+        """Profiles per-line memory use of core operations (opt-in via --memprofile)."""
+        memory_profiler = pytest.importorskip("memory_profiler")  # version: 0.60.0+
+
+        @memory_profiler.profile
+        def run_operations() -> bool:
+            task = task_manager.create_task("Memory profile task")
+            task_manager.get_task(task.id)
+            return task_manager.complete_task(task.id)
+
+        assert run_operations()
+
     def test_bulk_operation_performance(self, task_manager: TaskManager):
         """Tests performance with larger data sets."""
         # Create 100 tasks and measure time
@@ -193,15 +248,7 @@ class TestSecurity:
 
     def test_input_sanitization(self, task_manager: TaskManager):
         """Tests input sanitization and injection prevention."""
-        dangerous_inputs = [
-            "'; DROP TABLE tasks; --",
-            "<script>alert('xss')</script>",
-            "../../../etc/passwd",
-            "\x00\x1f\x7f",
-            "{{7*7}}"
-        ]
-        
-        for dangerous_input in dangerous_inputs:
+        for dangerous_input in DANGEROUS_INPUTS:
             with pytest.raises(TaskValidationError):
                 task_manager.create_task(dangerous_input)
 
@@ -16,7 +16,9 @@ from ..core.validators import (
     validate_task_description,
     validate_menu_option,
     validate_task_number,
-    validate_task_data
+    validate_task_number_int,
+    validate_task_data,
+    has_only_description_chars
 )
 from ..types.custom_types import TaskDict
 from ..exceptions.validation_exceptions import (
@@ -29,7 +31,7 @@ from ..exceptions.validation_exceptions import (
 # Test data constants
 VALID_TASK_DESCRIPTION = "Buy groceries"
 VALID_UNICODE_DESCRIPTION = "Comprar víveres"
-INVALID_TASK_DESCRIPTIONS = [
+INVALID_TASK_DESCRIPTIONS = (
     None,
     "",
     " " * 5,
@@ -39,7 +41,9 @@ INVALID_TASK_DESCRIPTIONS = [
     "<script>alert('xss')</script>",
     "../path/traversal",
     "DROP TABLE tasks;"
-]
+)
+# Short fixed test IDs, so collection does not repr() each description
+INVALID_TASK_DESCRIPTION_IDS = tuple(f"d{i}" for i in range(len(INVALID_TASK_DESCRIPTIONS)))
 
 VALID_MENU_OPTIONS = ["1", "2", "3", "4"]
 INVALID_MENU_OPTIONS = [
@@ -56,15 +60,17 @@ INVALID_MENU_OPTIONS = [
     "\n4"
 ]
 
+VALID_TIMESTAMP = datetime(2024, 1, 1, 10, 0, 0)
 VALID_TASK_DATA = {
     "id": 1,
     "description": "Valid task",
     "status": "pending",
-    "created": datetime(2024, 1, 1, 10, 0, 0),
-    "modified": datetime(2024, 1, 1, 10, 0, 0)
+    "created": VALID_TIMESTAMP,
+    "modified": VALID_TIMESTAMP
 }
 
-INVALID_TASK_DATA_SAMPLES = [
+# Built once at import; the validator only reads these dictionaries
+INVALID_TASK_DATA_SAMPLES = (
     {},  # Empty dictionary
     {"id": "abc", "status": "pending"},  # Missing description
     {"id": 1, "description": "", "status": "unknown"},  # Invalid status
@@ -73,7 +79,7 @@ INVALID_TASK_DATA_SAMPLES = [
     {"description": "Valid", "status": "pending"},  # Missing ID
     {"id": 1, "description": None, "status": "pending"},  # None description
     {"id": 1, "description": "Valid", "status": None}  # None status
-]
+)
 
 @pytest.mark.timeout(1)
 def test_validate_task_description_valid():
@@ -84,7 +90,8 @@ def test_validate_task_description_valid():
     assert validate_task_description("Task with punctuation!") is True
 
 @pytest.mark.timeout(1)
-@pytest.mark.parametrize("invalid_description", INVALID_TASK_DESCRIPTIONS)
+@pytest.mark.parametrize("invalid_description", INVALID_TASK_DESCRIPTIONS,
+                         ids=INVALID_TASK_DESCRIPTION_IDS)
 def test_validate_task_description_invalid(invalid_description):
     """Test validation of invalid task descriptions."""
     with pytest.raises(TaskDescriptionValidationError) as exc_info:
@@ -92,6 +99,14 @@ def test_validate_task_description_invalid(invalid_description):
     assert exc_info.value.error_code == "E001"
     assert "[E001]" in str(exc_info.value)
 
+@pytest.mark.timeout(1)
+def test_has_only_description_chars():
+    """Test the shared description character check on ASCII and non-ASCII text."""
+    assert has_only_description_chars("Buy milk, eggs - now!") is True
+    assert has_only_description_chars("Tabs\tand\u00a0spaces") is True
+    assert has_only_description_chars("Task; DROP") is False
+    assert has_only_description_chars("Caf\u00e9") is False
+
 @pytest.mark.timeout(1)
 @pytest.mark.parametrize("valid_option", VALID_MENU_OPTIONS)
 def test_validate_menu_option_valid(valid_option):
@@ -129,6 +144,22 @@ def test_validate_task_number_invalid(invalid_number):
     assert "[E003]" in str(exc_info.value)
     assert str(max_tasks) in str(exc_info.value)
 
+@pytest.mark.timeout(1)
+def test_validate_task_number_int_valid():
+    """Test validation of already-parsed task numbers."""
+    max_tasks = 5
+    for i in range(1, max_tasks + 1):
+        assert validate_task_number_int(i, max_tasks) == i
+
+@pytest.mark.timeout(1)
+@pytest.mark.parametrize("invalid_number", [0, 6, -1, 1.5, "1", None, True])
+def test_validate_task_number_int_invalid(invalid_number):
+    """Test rejection of out-of-range and non-integer task numbers."""
+    max_tasks = 5
+    with pytest.raises(TaskNumberValidationError) as exc_info:
+        validate_task_number_int(invalid_number, max_tasks)
+    assert exc_info.value.error_code == "E003"
+
 def test_validate_task_data_valid():
     """Test validation of valid task data structure."""
     assert validate_task_data(VALID_TASK_DATA) is True
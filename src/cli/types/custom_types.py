@@ -8,11 +8,11 @@ specification for tasks and metadata.
 Version: 1.0
 """
 
-from typing import TypeVar, TypeAlias, Literal, Dict, Union, List  # Python 3.6+
+from typing import TypeAlias, Literal, Dict, Union, List  # Python 3.6+
 from datetime import datetime
 
-# Type variable for task IDs that can be either integer or string
-TaskId = TypeVar('TaskId', int, str)
+# Type alias for task IDs; IDs are sequential integers assigned by TaskManager
+TaskId: TypeAlias = int
 
 # Literal type for constraining task status values
 TaskStatus = Literal['pending', 'completed']
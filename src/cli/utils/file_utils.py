@@ -10,18 +10,92 @@ Python: 3.6+
 
 import os
 import json
-import shutil
-import tempfile
-from typing import Dict, Any, Optional
-from pathlib import Path
+import functools
+from typing import Dict, Any, Optional, Set
 
 from ..config.settings import FILE_SETTINGS
-from ..exceptions.storage_exceptions import FileAccessError, DataCorruptionError
+from ..exceptions.storage_exceptions import FileAccessError, FileNotFoundStorageError, DataCorruptionError
 from ..logging.logger import get_logger
 
+# orjson is an optional accelerator; fall back to the stdlib encoder without it
+try:
+    import orjson  # version: 3.0+
+except ImportError:
+    orjson = None
+
+def encode_json(data: Any) -> bytes:
+    """
+    Serializes data to compact UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def decode_json(raw: bytes) -> Any:
+    """
+    Parses UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        raw: Encoded JSON
+
+    Returns:
+        Any: Parsed data
+
+    Raises:
+        json.JSONDecodeError: If raw is not valid JSON (orjson's error is a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 # Initialize logger for file operations
 logger = get_logger()
 
+# Home directory all data paths must live under, resolved once at import
+_HOME = os.path.expanduser('~')
+_DANGEROUS_PATTERNS = ('..', '//', '\\\\')
+# Exclusive create that refuses to follow a planted symlink at the temp path
+_TEMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_NOFOLLOW', 0)
+# Absolute paths whose permissions this process has already verified or set
+_PERMISSIONS_VERIFIED: Set[str] = set()
+
+@functools.lru_cache(maxsize=64)
+def _resolve_safe_path(file_path: str) -> str:
+    """
+    Resolves a path to absolute form and applies the pure string checks.
+
+    The result depends only on the argument, so it is memoized: the task
+    file path is validated on every read, write and backup. Rejected paths
+    raise, and lru_cache does not cache exceptions.
+
+    Args:
+        file_path: Path to resolve
+
+    Returns:
+        str: Absolute path
+
+    Raises:
+        FileAccessError: If the path is outside the home directory or contains
+            dangerous patterns
+    """
+    full_path = os.path.abspath(os.path.expanduser(file_path))
+
+    # Verify path is within user's home directory
+    if not full_path.startswith(_HOME):
+        raise FileAccessError("Access denied: Path must be within user's home directory")
+
+    # Check for dangerous patterns
+    if any(pattern in full_path for pattern in _DANGEROUS_PATTERNS):
+        raise FileAccessError("Invalid path: Contains dangerous patterns")
+
+    return full_path
+
 def validate_file_path(file_path: str) -> bool:
     """
     Validates file path for security and accessibility.
@@ -36,28 +110,25 @@ def validate_file_path(file_path: str) -> bool:
         FileAccessError: If path validation fails
     """
     try:
-        # Expand user path and convert to absolute
-        full_path = os.path.abspath(os.path.expanduser(file_path))
-        path_obj = Path(full_path)
-
-        # Security checks
-        if not path_obj.parent.exists():
-            os.makedirs(path_obj.parent, mode=FILE_SETTINGS['FILE_PERMISSIONS'])
-
-        # Verify path is within user's home directory
-        if not str(path_obj).startswith(os.path.expanduser('~')):
-            raise FileAccessError("Access denied: Path must be within user's home directory")
-
-        # Check for dangerous patterns
-        dangerous_patterns = ['..', '//', '\\\\']
-        if any(pattern in str(path_obj) for pattern in dangerous_patterns):
-            raise FileAccessError("Invalid path: Contains dangerous patterns")
-
-        # Verify permissions if file exists
-        if path_obj.exists():
-            current_mode = os.stat(path_obj).st_mode & 0o777
-            if current_mode != FILE_SETTINGS['FILE_PERMISSIONS']:
-                os.chmod(path_obj, FILE_SETTINGS['FILE_PERMISSIONS'])
+        # Expand user path, convert to absolute and run the string checks
+        full_path = _resolve_safe_path(file_path)
+
+        # Filesystem state can change between calls, so these are not cached
+        parent = os.path.dirname(full_path)
+        if not os.path.isdir(parent):
+            os.makedirs(parent, mode=FILE_SETTINGS['FILE_PERMISSIONS'])
+
+        # Verify permissions if file exists, once per path per process; files
+        # written by write_json_file are registered as verified
+        if full_path not in _PERMISSIONS_VERIFIED:
+            try:
+                current_mode = os.stat(full_path).st_mode & 0o777
+            except FileNotFoundError:
+                current_mode = None
+            if current_mode is not None:
+                if current_mode != FILE_SETTINGS['FILE_PERMISSIONS']:
+                    os.chmod(full_path, FILE_SETTINGS['FILE_PERMISSIONS'])
+                _PERMISSIONS_VERIFIED.add(full_path)
 
         logger.debug(f"Path validation successful: {file_path}")
         return True
@@ -77,18 +148,15 @@ def read_json_file(file_path: str) -> Dict[str, Any]:
         dict: Parsed JSON data
 
     Raises:
+        FileNotFoundStorageError: If file does not exist
         FileAccessError: If file access fails
         DataCorruptionError: If JSON parsing fails
     """
     try:
         validate_file_path(file_path)
-        
-        if not os.path.exists(file_path):
-            logger.info(f"File not found, returning empty data: {file_path}")
-            return {"tasks": [], "metadata": {"version": "1.0", "task_count": 0}}
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = decode_json(f.read())
 
         # Validate basic structure
         if not isinstance(data, dict) or "tasks" not in data or "metadata" not in data:
@@ -100,6 +168,9 @@ def read_json_file(file_path: str) -> Dict[str, Any]:
     except json.JSONDecodeError as e:
         logger.error(f"JSON parsing failed: {str(e)}")
         raise DataCorruptionError("Invalid JSON format in file")
+    except FileNotFoundError:
+        logger.info(f"File not found: {file_path}")
+        raise FileNotFoundStorageError(f"File not found: {file_path}")
     except (OSError, PermissionError) as e:
         logger.error(f"File read failed: {str(e)}")
         raise FileAccessError(f"Unable to read file: {file_path}")
@@ -121,58 +192,76 @@ def write_json_file(file_path: str, data: Dict[str, Any]) -> bool:
     try:
         validate_file_path(file_path)
         
-        # Create backup if file exists
-        if os.path.exists(file_path):
-            create_backup(file_path)
+        # Create backup if file exists; a first write has nothing to back up
+        create_backup(file_path, missing_ok=True)
 
-        # Create temporary file for atomic write
-        temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path))
+        # Create temporary file for atomic write, beside the target so the
+        # replace stays on one filesystem; the mode is set at creation
+        temp_path = f"{file_path}.tmp.{os.getpid()}"
         try:
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            # Set proper permissions before moving
-            os.chmod(temp_path, FILE_SETTINGS['FILE_PERMISSIONS'])
+            temp_fd = os.open(temp_path, _TEMP_OPEN_FLAGS, FILE_SETTINGS['FILE_PERMISSIONS'])
+        except FileExistsError:
+            # Leftover from an interrupted write by a process with our pid
+            os.unlink(temp_path)
+            temp_fd = os.open(temp_path, _TEMP_OPEN_FLAGS, FILE_SETTINGS['FILE_PERMISSIONS'])
+        try:
+            # Compact UTF-8 output
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(encode_json(data))
             
             # Atomic replace
             os.replace(temp_path, file_path)
-            
-            logger.debug(f"Successfully wrote JSON file: {file_path}")
-            return True
-
-        finally:
-            # Clean up temp file if still exists
-            if os.path.exists(temp_path):
+        except BaseException:
+            # Clean up the temp file; it is gone once the replace succeeded
+            try:
                 os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        _PERMISSIONS_VERIFIED.add(_resolve_safe_path(file_path))
+        logger.debug(f"Successfully wrote JSON file: {file_path}")
+        return True
 
     except (OSError, PermissionError) as e:
         logger.error(f"File write failed: {str(e)}")
         raise FileAccessError(f"Unable to write file: {file_path}")
 
-def create_backup(file_path: str) -> str:
+def create_backup(file_path: str, missing_ok: bool = False) -> str:
     """
     Creates secure backup of specified file.
 
+    Only the file itself is copied; use TaskStorage.create_backup to include
+    changes still held in the storage journal.
+
     Args:
         file_path: Path to file to backup
+        missing_ok: Skip the warning when there is no file to back up
 
     Returns:
-        str: Path to backup file
+        str: Path to backup file, or an empty string if the file does not exist
 
     Raises:
         FileAccessError: If backup creation fails
     """
     try:
-        if not os.path.exists(file_path):
-            logger.warning(f"No file to backup: {file_path}")
-            return ""
-
         backup_path = f"{file_path}.bak"
         validate_file_path(backup_path)
 
-        # Secure copy with metadata preservation
-        shutil.copy2(file_path, backup_path)
+        # Deferred: shutil (and its compression imports) is only needed once
+        # something is saved, not for sessions that just view and exit
+        import shutil
+
+        # Secure copy with metadata preservation; opening the source is the
+        # existence check
+        try:
+            shutil.copy2(file_path, backup_path)
+        except FileNotFoundError:
+            if not missing_ok:
+                logger.warning(f"No file to backup: {file_path}")
+            return ""
         os.chmod(backup_path, FILE_SETTINGS['FILE_PERMISSIONS'])
+        _PERMISSIONS_VERIFIED.add(_resolve_safe_path(backup_path))
 
         logger.debug(f"Successfully created backup: {backup_path}")
         return backup_path
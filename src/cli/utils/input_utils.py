@@ -5,10 +5,13 @@ Provides secure input validation, sanitization, and standardized input collectio
 Version: 1.0
 """
 
-import re  # version: 3.6+
+import os
+import stat
+import sys
 from typing import Union  # version: 3.6+
 
 from ..constants.messages import ERROR_MESSAGES, MENU_MESSAGES
+from ..core.validators import has_only_description_chars
 from ..exceptions.validation_exceptions import (
     ValidationError,
     TaskDescriptionValidationError,
@@ -19,8 +22,47 @@ from ..types.custom_types import TaskId
 
 # Constants for input validation
 TASK_DESCRIPTION_MAX_LENGTH = 200
-VALID_MENU_OPTIONS = [1, 2, 3, 4]
-TASK_DESCRIPTION_PATTERN = r'^[a-zA-Z0-9\s\.,!?-]*$'
+VALID_MENU_OPTIONS = frozenset((1, 2, 3, 4))
+_VALID_MENU_OPTION_STRINGS = frozenset(str(option) for option in VALID_MENU_OPTIONS)
+
+def _stdin_is_piped() -> bool:
+    """
+    Checks whether stdin is a pipe or regular file rather than a terminal.
+    
+    Returns:
+        bool: True for scripted/piped input, False for a tty or replaced stdin
+    """
+    try:
+        mode = os.fstat(sys.stdin.fileno()).st_mode
+    except (AttributeError, OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISREG(mode)
+
+def read_line(prompt: str = '') -> str:
+    """
+    Reads one line of user input, using buffered stdin reads for piped input.
+    
+    Stdin is checked on every call, so a stdin replaced after import (as
+    under test capture) falls back to input() and any stub installed there.
+    
+    Args:
+        prompt (str): Prompt to display before reading
+        
+    Returns:
+        str: Line read, without the trailing newline
+        
+    Raises:
+        EOFError: If input is exhausted
+    """
+    if not _stdin_is_piped():
+        return input(prompt)
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
 
 def get_menu_option() -> int:
     """
@@ -32,13 +74,14 @@ def get_menu_option() -> int:
     Raises:
         MenuOptionValidationError: If input is invalid
     """
-    try:
-        option = input(MENU_MESSAGES['choice_prompt']).strip()
-        validate_menu_option(option)
-        return int(option)
-    except ValidationError as e:
-        print(e.message)
-        return get_menu_option()
+    # Re-prompt in a loop so repeated invalid input cannot exhaust the stack
+    while True:
+        try:
+            option = read_line(MENU_MESSAGES['choice_prompt']).strip()
+            validate_menu_option(option)
+            return int(option)
+        except ValidationError as e:
+            print(e.message)
 
 def get_task_description() -> str:
     """
@@ -50,14 +93,14 @@ def get_task_description() -> str:
     Raises:
         TaskDescriptionValidationError: If description is invalid
     """
-    description = input(MENU_MESSAGES['add_task_prompt']).strip()
-    
-    try:
-        validate_task_description(description)
-        return description
-    except ValidationError as e:
-        print(e.message)
-        return get_task_description()
+    while True:
+        description = read_line(MENU_MESSAGES['add_task_prompt']).strip()
+        
+        try:
+            validate_task_description(description)
+            return description
+        except ValidationError as e:
+            print(e.message)
 
 def get_task_number(max_tasks: int) -> TaskId:
     """
@@ -72,13 +115,13 @@ def get_task_number(max_tasks: int) -> TaskId:
     Raises:
         TaskNumberValidationError: If task number is invalid
     """
-    try:
-        number = input(MENU_MESSAGES['complete_task_prompt']).strip()
-        validate_task_number(number, max_tasks)
-        return int(number)
-    except ValidationError as e:
-        print(e.message)
-        return get_task_number(max_tasks)
+    while True:
+        try:
+            number = read_line(MENU_MESSAGES['complete_task_prompt']).strip()
+            validate_task_number(number, max_tasks)
+            return int(number)
+        except ValidationError as e:
+            print(e.message)
 
 def validate_menu_option(option: str) -> bool:
     """
@@ -93,6 +136,10 @@ def validate_menu_option(option: str) -> bool:
     Raises:
         MenuOptionValidationError: If option is invalid
     """
+    # Fast path for the exact strings a user normally types
+    if option in _VALID_MENU_OPTION_STRINGS:
+        return True
+    
     if not option.isdigit():
         raise MenuOptionValidationError(ERROR_MESSAGES['invalid_input'])
     
@@ -121,7 +168,8 @@ def validate_task_description(description: str) -> bool:
     if len(description) > TASK_DESCRIPTION_MAX_LENGTH:
         raise TaskDescriptionValidationError(ERROR_MESSAGES['description_too_long'])
     
-    if not re.match(TASK_DESCRIPTION_PATTERN, description):
+    # Validate allowed characters with a single translate pass
+    if not has_only_description_chars(description):
         raise TaskDescriptionValidationError(ERROR_MESSAGES['invalid_chars'])
     
     return True
@@ -7,8 +7,9 @@ Version: 1.0
 """
 
 from typing import List, Optional  # Python 3.6+
+import functools
 import os
-import shutil
+import sys
 from datetime import datetime
 
 from ..constants.messages import (
@@ -32,54 +33,133 @@ MENU_PADDING = 2
 MAX_TASK_DESCRIPTION_LENGTH = 60
 TASKS_PER_PAGE = 10
 
+# Header rows that depend only on module constants, built once at import
+_HEADER_INNER_WIDTH = SCREEN_WIDTH - 2
+_HEADER_TOP = (f"{BORDER_SYMBOLS['TOP_LEFT']}{BORDER_SYMBOLS['HORIZONTAL'] * _HEADER_INNER_WIDTH}"
+               f"{BORDER_SYMBOLS['TOP_RIGHT']}")
+_HEADER_BOTTOM = (f"{BORDER_SYMBOLS['BOTTOM_LEFT']}{BORDER_SYMBOLS['HORIZONTAL'] * _HEADER_INNER_WIDTH}"
+                  f"{BORDER_SYMBOLS['BOTTOM_RIGHT']}")
+_NAV_HINTS = (f"{NAVIGATION_SYMBOLS['BACK']} Back "
+              f"{MENU_SYMBOLS['SEPARATOR']} "
+              f"{ACTION_SYMBOLS['HELP']} Help "
+              f"{MENU_SYMBOLS['SEPARATOR']} "
+              f"{NAVIGATION_SYMBOLS['ESCAPE']} Exit")
+_HEADER_NAV = f"{BORDER_SYMBOLS['VERTICAL']}{_NAV_HINTS.center(_HEADER_INNER_WIDTH)}{BORDER_SYMBOLS['VERTICAL']}"
+
+# ANSI cursor-home + erase-display; replaces spawning `clear`/`cls`
+_CLEAR_SEQUENCE = '\x1b[H\x1b[2J'
+
+# Whether stdout is an interactive terminal; checked once at import
+try:
+    _STDOUT_IS_TTY = sys.stdout.isatty()
+except (AttributeError, ValueError):
+    _STDOUT_IS_TTY = False
+
+# Windows console flag that makes it interpret ANSI escape sequences
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+_STD_OUTPUT_HANDLE = -11
+
+def _enable_windows_ansi() -> bool:
+    """
+    Turns on ANSI escape handling for the Windows console attached to stdout.
+
+    Returns:
+        bool: True if the console now interprets ANSI sequences
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(_STD_OUTPUT_HANDLE)
+        mode = wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(
+            handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except (AttributeError, ImportError, OSError):
+        return False
+
+# POSIX terminals always handle ANSI; Windows 10+ consoles once enabled
+_ANSI_ENABLED = _STDOUT_IS_TTY and (os.name != 'nt' or _enable_windows_ansi())
+
 def clear_screen() -> None:
     """
     Clears the terminal screen in a cross-platform manner with fallback support.
-    Handles different operating systems and terminal types safely.
+    Handles different operating systems and terminal types safely; does nothing
+    when output is redirected to a file or pipe.
     """
+    if not _STDOUT_IS_TTY:
+        return
     try:
-        # Windows
-        if os.name == 'nt':
-            os.system('cls')
-        # Unix/Linux/MacOS
+        if _ANSI_ENABLED:
+            sys.stdout.write(_CLEAR_SEQUENCE)
+            sys.stdout.flush()
+        # Legacy Windows console without ANSI support
         else:
-            os.system('clear')
+            os.system('cls')
     except Exception:
         # Fallback to printing newlines if system commands fail
         print('\n' * 100)
 
-def print_header(title: str, show_navigation: bool = True) -> None:
+def _header_lines(title: str, show_navigation: bool) -> List[str]:
     """
-    Prints the application header with borders and optional navigation hints.
+    Builds the application header lines with borders and optional navigation hints.
 
     Args:
         title (str): The title to display in the header
-        show_navigation (bool): Whether to show navigation hints
+        show_navigation (bool): Whether to include navigation hints
+
+    Returns:
+        List[str]: Header lines, without trailing newlines
     """
-    # Create top border
-    print(f"{BORDER_SYMBOLS['TOP_LEFT']}{BORDER_SYMBOLS['HORIZONTAL'] * (SCREEN_WIDTH - 2)}"
-          f"{BORDER_SYMBOLS['TOP_RIGHT']}")
-    
-    # Center title
-    padding = (SCREEN_WIDTH - len(title) - 2) // 2
-    print(f"{BORDER_SYMBOLS['VERTICAL']}{' ' * padding}{title}"
-          f"{' ' * (SCREEN_WIDTH - padding - len(title) - 2)}{BORDER_SYMBOLS['VERTICAL']}")
+    # Center title; at an even inner width str.center puts any odd space on
+    # the right
+    lines = [_HEADER_TOP,
+             f"{BORDER_SYMBOLS['VERTICAL']}{title.center(_HEADER_INNER_WIDTH)}{BORDER_SYMBOLS['VERTICAL']}"]
     
     # Add navigation hints if requested
     if show_navigation:
-        nav_line = (f"{NAVIGATION_SYMBOLS['BACK']} Back "
-                   f"{MENU_SYMBOLS['SEPARATOR']} "
-                   f"{ACTION_SYMBOLS['HELP']} Help "
-                   f"{MENU_SYMBOLS['SEPARATOR']} "
-                   f"{NAVIGATION_SYMBOLS['ESCAPE']} Exit")
-        nav_padding = (SCREEN_WIDTH - len(nav_line) - 2) // 2
-        print(f"{BORDER_SYMBOLS['VERTICAL']}{' ' * nav_padding}{nav_line}"
-              f"{' ' * (SCREEN_WIDTH - nav_padding - len(nav_line) - 2)}"
-              f"{BORDER_SYMBOLS['VERTICAL']}")
+        lines.append(_HEADER_NAV)
     
-    # Bottom border
-    print(f"{BORDER_SYMBOLS['BOTTOM_LEFT']}{BORDER_SYMBOLS['HORIZONTAL'] * (SCREEN_WIDTH - 2)}"
-          f"{BORDER_SYMBOLS['BOTTOM_RIGHT']}")
+    lines.append(_HEADER_BOTTOM)
+    return lines
+
+def _write_lines(lines: List[str]) -> None:
+    """
+    Writes lines to stdout with a single write call.
+
+    sys.stdout is looked up on every call so redirected output is honoured.
+
+    Args:
+        lines (List[str]): Lines to write, without trailing newlines
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def print_header(title: str, show_navigation: bool = True) -> None:
+    """
+    Prints the application header with borders and optional navigation hints.
+
+    Args:
+        title (str): The title to display in the header
+        show_navigation (bool): Whether to show navigation hints
+    """
+    _write_lines(_header_lines(title, show_navigation))
+
+@functools.lru_cache(maxsize=1024)
+def _format_timestamp(timestamp: datetime) -> str:
+    """
+    Formats a task timestamp for display, memoized across redraws.
+
+    Task timestamps are naive UTC, so equal datetimes always format the same.
+
+    Args:
+        timestamp (datetime): Timestamp to format
+
+    Returns:
+        str: Timestamp as 'YYYY-MM-DD HH:MM'
+    """
+    return timestamp.strftime("%Y-%m-%d %H:%M")
 
 def format_task(task: Task, show_timestamps: bool = False) -> str:
     """
@@ -105,8 +185,8 @@ def format_task(task: Task, show_timestamps: bool = False) -> str:
     
     # Add timestamps if requested
     if show_timestamps:
-        created = task.created.strftime("%Y-%m-%d %H:%M")
-        modified = task.modified.strftime("%Y-%m-%d %H:%M")
+        created = _format_timestamp(task.created)
+        modified = _format_timestamp(task.modified)
         formatted_task = f"{formatted_task:<{MAX_TASK_DESCRIPTION_LENGTH + 8}} Created: {created} Modified: {modified}"
     
     return formatted_task
@@ -125,31 +205,34 @@ def print_task_list(tasks: List[Task], page_number: int = 1, show_timestamps: bo
     start_idx = (page_number - 1) * TASKS_PER_PAGE
     end_idx = min(start_idx + TASKS_PER_PAGE, len(tasks))
     
-    # Print header with page information
-    print_header("Task List", show_navigation=True)
+    # Build the whole frame, starting with header and page information
+    lines = _header_lines("Task List", True)
     if total_pages > 1:
-        print(f"Page {page_number}/{total_pages}")
+        lines.append(f"Page {page_number}/{total_pages}")
     
     # Handle empty task list
     if not tasks:
-        print(f"\n{MENU_SYMBOLS['INDENT']}{INFO_MESSAGES['no_tasks']}\n")
+        lines += ["", f"{MENU_SYMBOLS['INDENT']}{INFO_MESSAGES['no_tasks']}", ""]
+        _write_lines(lines)
         return
     
-    # Print tasks for current page
-    print()  # Empty line for spacing
-    for task in tasks[start_idx:end_idx]:
-        print(f"{MENU_SYMBOLS['INDENT']}{format_task(task, show_timestamps)}")
-    print()  # Empty line for spacing
+    # Tasks for current page, surrounded by empty lines for spacing
+    indent = MENU_SYMBOLS['INDENT']
+    lines.append("")
+    lines += [f"{indent}{format_task(task, show_timestamps)}" for task in tasks[start_idx:end_idx]]
+    lines.append("")
     
-    # Print task statistics
-    completed_count = sum(1 for task in tasks if task.status == 'completed')
-    print(INFO_MESSAGES['task_count'].format(
+    # Task statistics
+    completed_count = [task.status for task in tasks].count('completed')
+    lines.append(INFO_MESSAGES['task_count'].format(
         len(tasks), completed_count, len(tasks) - completed_count))
     
     # Show pagination navigation hints if multiple pages
     if total_pages > 1:
-        print(f"\n{NAVIGATION_SYMBOLS['BACK']}/{NAVIGATION_SYMBOLS['FORWARD']} "
-              f"Navigate pages | {NAVIGATION_SYMBOLS['RETURN']} Select")
+        lines += ["", f"{NAVIGATION_SYMBOLS['BACK']}/{NAVIGATION_SYMBOLS['FORWARD']} "
+                      f"Navigate pages | {NAVIGATION_SYMBOLS['RETURN']} Select"]
+    
+    _write_lines(lines)
 
 def print_message(message: str, message_type: str = 'info', use_border: bool = False) -> None:
     """
@@ -175,11 +258,13 @@ def print_message(message: str, message_type: str = 'info', use_border: bool = F
     # Add borders if requested
     if use_border:
         width = min(len(formatted_message) + 4, SCREEN_WIDTH)
-        print(f"{BORDER_SYMBOLS['TOP_LEFT']}{BORDER_SYMBOLS['HORIZONTAL'] * (width - 2)}"
-              f"{BORDER_SYMBOLS['TOP_RIGHT']}")
-        print(f"{BORDER_SYMBOLS['VERTICAL']} {formatted_message}"
-              f"{' ' * (width - len(formatted_message) - 4)} {BORDER_SYMBOLS['VERTICAL']}")
-        print(f"{BORDER_SYMBOLS['BOTTOM_LEFT']}{BORDER_SYMBOLS['HORIZONTAL'] * (width - 2)}"
-              f"{BORDER_SYMBOLS['BOTTOM_RIGHT']}")
+        _write_lines([
+            f"{BORDER_SYMBOLS['TOP_LEFT']}{BORDER_SYMBOLS['HORIZONTAL'] * (width - 2)}"
+            f"{BORDER_SYMBOLS['TOP_RIGHT']}",
+            f"{BORDER_SYMBOLS['VERTICAL']} {formatted_message}"
+            f"{' ' * (width - len(formatted_message) - 4)} {BORDER_SYMBOLS['VERTICAL']}",
+            f"{BORDER_SYMBOLS['BOTTOM_LEFT']}{BORDER_SYMBOLS['HORIZONTAL'] * (width - 2)}"
+            f"{BORDER_SYMBOLS['BOTTOM_RIGHT']}"
+        ])
     else:
         print(formatted_message)
\ No newline at end of file